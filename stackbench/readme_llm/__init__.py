@@ -47,7 +47,6 @@ from .schemas import (
     ReadMeLLMOutput,
 )
 
-from .generator import ReadMeLLMGenerator
 
 __all__ = [
     # Main generator
@@ -73,3 +72,17 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name):
+    """
+    Import ReadMeLLMGenerator on first access (PEP 562).
+
+    The generator pulls in every extractor, matcher and formatter, which
+    processes that only need the schemas or introspection (e.g. worker
+    processes) shouldn't pay for at import time.
+    """
+    if name == "ReadMeLLMGenerator":
+        from .generator import ReadMeLLMGenerator
+        return ReadMeLLMGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
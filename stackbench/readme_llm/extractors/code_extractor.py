@@ -11,17 +11,54 @@ Provides full metadata including language, location, section hierarchy,
 and snippet source information.
 """
 
+import os
 import re
+import json
 import hashlib
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Iterable, Iterator, List, Optional, Set, Tuple, Dict
 from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from stackbench.readme_llm import schemas
 from stackbench.readme_llm.schemas import CodeExample
 
 logger = logging.getLogger(__name__)
 
+# Threads used to read documentation files concurrently (reads are I/O-bound)
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Reads allowed in flight ahead of parsing, bounding file contents in memory
+READ_AHEAD = READ_WORKERS * 2
+
+# Bump to invalidate cached examples when extraction changes in a way the
+# source hash below can't see (e.g. a dependency's behaviour)
+EXAMPLES_CACHE_VERSION = 1
+
+
+def _extractor_hash() -> bytes:
+    """
+    Hash the extraction logic that cached examples depend on.
+
+    Covers this module and the CodeExample schema, so upgrading or editing
+    either invalidates the examples cache.
+    """
+    digest = hashlib.blake2b(str(EXAMPLES_CACHE_VERSION).encode('utf-8'), digest_size=16)
+    for module_file in (__file__, schemas.__file__):
+        try:
+            digest.update(Path(module_file).read_bytes())
+        except OSError:
+            # Source not shipped (e.g. bytecode-only install); the
+            # version constant still salts the key
+            pass
+    return digest.digest()
+
+
+# Salt for examples cache keys, computed once per process
+_EXTRACTOR_HASH = _extractor_hash()
+
 
 @dataclass
 class ExtractedBlock:
@@ -88,10 +125,23 @@ class CodeExampleExtractor:
         if not file_path.exists():
             raise ValueError(f"File does not exist: {file_path}")
 
-        logger.debug(f"Extracting code from: {file_path.name}")
-
         content = file_path.read_text(encoding='utf-8', errors='ignore')
 
+        return self.extract_from_content(file_path, content)
+
+    def extract_from_content(self, file_path: Path, content: str) -> List[CodeExample]:
+        """
+        Extract all code examples from already-read documentation content.
+
+        Args:
+            file_path: Path the content was read from (used for IDs and source_file)
+            content: Documentation file content
+
+        Returns:
+            List of CodeExample objects with full metadata
+        """
+        logger.debug(f"Extracting code from: {file_path.name}")
+
         # Build section hierarchy from headings
         section_hierarchy = self._build_section_hierarchy(content)
 
@@ -332,13 +382,21 @@ class CodeExampleExtractor:
         return list(set(apis))
 
 
-def extract_code_examples(file_paths: List[Path], docs_base_path: Path) -> Dict[str, List[CodeExample]]:
+def extract_code_examples(
+    file_paths: Iterable[Path],
+    docs_base_path: Path,
+    cache_dir: Optional[Path] = None
+) -> Dict[str, List[CodeExample]]:
     """
     Convenience function to extract code examples from multiple files.
 
     Args:
-        file_paths: List of documentation files
+        file_paths: Documentation files (any iterable, e.g. the lazy
+            iter_documentation() walk, is consumed once)
         docs_base_path: Base documentation directory
+        cache_dir: Optional directory caching extracted examples by file
+            content hash, so unchanged files are not re-parsed on later runs.
+            Entries not used by this run are pruned afterwards.
 
     Returns:
         Dictionary mapping file paths to lists of CodeExample objects
@@ -351,16 +409,153 @@ def extract_code_examples(file_paths: List[Path], docs_base_path: Path) -> Dict[
     """
     extractor = CodeExampleExtractor(docs_base_path)
     results = {}
-
-    for file_path in file_paths:
-        try:
-            examples = extractor.extract_from_file(file_path)
-            if examples:
-                results[str(file_path)] = examples
-        except Exception as e:
-            logger.error(f"Error extracting from {file_path}: {e}")
+    file_count = 0
+    cache_hits = 0
+    used_cache_files = set()
+
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Files are read on a thread pool; parsing stays on this thread and
+    # consumes the reads in input order
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        for file_path, data, read_error in _read_files(executor, file_paths):
+            file_count += 1
+            try:
+                if read_error is not None:
+                    raise read_error
+
+                if cache_dir is None:
+                    examples = extractor.extract_from_content(file_path, _decode_content(data))
+                else:
+                    cache_path = cache_dir / f"{_examples_cache_key(file_path, docs_base_path, data)}.json"
+                    used_cache_files.add(cache_path.name)
+                    examples = _load_cached_examples(cache_path)
+                    if examples is None:
+                        examples = extractor.extract_from_content(file_path, _decode_content(data))
+                        _save_cached_examples(cache_path, examples)
+                    else:
+                        cache_hits += 1
+
+                if examples:
+                    results[str(file_path)] = examples
+            except Exception as e:
+                logger.error(f"Error extracting from {file_path}: {e}")
 
     total_examples = sum(len(v) for v in results.values())
-    logger.info(f"Extracted {total_examples} code examples from {len(file_paths)} files")
+    logger.info(f"Extracted {total_examples} code examples from {file_count} files")
+    if cache_dir is not None:
+        logger.info(f"Reused cached examples for {cache_hits} unchanged files")
+        _prune_cached_examples(cache_dir, used_cache_files)
 
     return results
+
+
+def _read_files(
+    executor: ThreadPoolExecutor,
+    file_paths: Iterable[Path]
+) -> Iterator[Tuple[Path, Optional[bytes], Optional[Exception]]]:
+    """
+    Read files on an executor, yielding results in input order.
+
+    At most READ_AHEAD reads are in flight, so file_paths is consumed
+    lazily and only a bounded number of file contents are held in memory
+    (executor.map would submit, and buffer, every read upfront).
+    """
+    pending = deque()
+    for file_path in file_paths:
+        pending.append(executor.submit(_read_file, file_path))
+        if len(pending) >= READ_AHEAD:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _read_file(file_path: Path) -> Tuple[Path, Optional[bytes], Optional[Exception]]:
+    """Read a file's bytes, returning the error instead of raising it."""
+    try:
+        return file_path, file_path.read_bytes(), None
+    except Exception as e:
+        return file_path, None, e
+
+
+def _decode_content(data: bytes) -> str:
+    """
+    Decode file bytes the way read_text(errors='ignore') would.
+
+    Newlines are normalized to match text-mode reads, since line numbers
+    and code blocks are parsed from the decoded content.
+    """
+    return data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _examples_cache_key(file_path: Path, docs_base_path: Path, data: bytes) -> str:
+    """
+    Build the cache key for a documentation file.
+
+    The relative path is part of the key because example IDs and
+    source_file are derived from it, not just from the content. The key is
+    salted with the extractor hash, so entries written by other extraction
+    logic are never reused.
+    """
+    relative_path = str(Path(file_path).relative_to(docs_base_path))
+    digest = hashlib.blake2b(_EXTRACTOR_HASH, digest_size=16)
+    digest.update(relative_path.encode('utf-8') + b'\0')
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def _load_cached_examples(cache_path: Path) -> Optional[List[CodeExample]]:
+    """Load cached examples, or None on a miss or unreadable cache file."""
+    if not cache_path.exists():
+        return None
+
+    try:
+        return [
+            CodeExample.model_validate(example)
+            for example in json.loads(cache_path.read_bytes())
+        ]
+    except Exception as e:
+        logger.warning(f"Ignoring invalid examples cache {cache_path}: {e}")
+        return None
+
+
+def _prune_cached_examples(cache_dir: Path, keep: Set[str]):
+    """
+    Remove cached examples not used by the current run.
+
+    Entries for edited or deleted files, and for older extractor versions,
+    are never hit again, so they are dropped instead of piling up.
+
+    Args:
+        cache_dir: Examples cache directory
+        keep: Names of cache files used by this run
+    """
+    removed = 0
+    for cache_path in cache_dir.glob("*.json"):
+        if cache_path.name in keep:
+            continue
+        try:
+            cache_path.unlink()
+            removed += 1
+        except OSError as e:
+            logger.warning(f"Could not remove stale examples cache {cache_path}: {e}")
+
+    if removed:
+        logger.debug(f"Pruned {removed} stale examples cache entries")
+
+
+def _save_cached_examples(cache_path: Path, examples: List[CodeExample]):
+    """Atomically write extracted examples to the cache."""
+    try:
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps([example.model_dump(mode='json') for example in examples]),
+            encoding='utf-8'
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # Caching is best-effort
+        logger.warning(f"Could not write examples cache {cache_path}: {e}")
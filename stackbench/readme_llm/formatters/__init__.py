@@ -1,11 +1,12 @@
 """Output formatters for README.LLM system."""
 
-from .readme_llm_formatter import ReadMeLLMFormatter, generate_readme_llm
+from .readme_llm_formatter import ReadMeLLMFormatter, generate_readme_llm, write_readme_llm
 from .knowledge_base_builder import KnowledgeBaseBuilder, build_knowledge_base
 
 __all__ = [
     "ReadMeLLMFormatter",
     "generate_readme_llm",
+    "write_readme_llm",
     "KnowledgeBaseBuilder",
     "build_knowledge_base",
 ]
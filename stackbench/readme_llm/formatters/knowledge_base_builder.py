@@ -20,12 +20,25 @@ knowledge_base/
 │   │   └── search_ex1.json
 │   └── typescript/
 └── metadata.json                 # Generation stats
+
+Per-entry files are written as compact JSON (they are machine-read);
+index.json, library_overview.json and metadata.json stay pretty-printed.
+
+With shard_files=True, each language directory is replaced by a single
+JSONL shard (api_catalog/python.jsonl, examples_db/python.jsonl) and the
+index records the byte offset and length of every entry in its shard.
+
+Rebuilds skip rewriting API/example files whose content has not changed,
+using a manifest of content hashes kept in .content_hashes.json.
 """
 
 import json
+import os
+import hashlib
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from stackbench.readme_llm.schemas import (
@@ -37,6 +50,15 @@ from stackbench.readme_llm.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Per-file writes are IO-bound, so the pool can be wider than the CPU count
+WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Manifest of per-file content hashes used to skip unchanged writes
+CONTENT_HASHES_FILE = ".content_hashes.json"
+
+# Characters that are unsafe in knowledge base filenames
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '.:/\\ '})
+
 
 class KnowledgeBaseBuilder:
     """
@@ -46,23 +68,32 @@ class KnowledgeBaseBuilder:
     individual JSON files for APIs and examples, and master index.
     """
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, shard_files: bool = False):
         """
         Initialize knowledge base builder.
 
         Args:
             output_dir: Base directory for knowledge base
+            shard_files: Pack each language's APIs/examples into one JSONL
+                shard instead of one JSON file per entry
         """
         self.output_dir = Path(output_dir)
         self.api_catalog_dir = self.output_dir / "api_catalog"
         self.examples_db_dir = self.output_dir / "examples_db"
+        self.shard_files = shard_files
+
+        # index.json records, built from the few fields the index needs while
+        # entries are written: {language: {entry_id: record}}
+        self._api_index: Dict[str, Dict[str, Dict]] = {}
+        self._example_index: Dict[str, Dict[str, Dict]] = {}
 
     def build(
         self,
         library_overview: LibraryOverview,
         api_entries_by_language: Dict[str, List[APIEntry]],
         example_entries_by_language: Dict[str, List[ExampleEntry]],
-        generation_mode: str = "standalone"
+        generation_mode: str = "standalone",
+        timestamp: Optional[str] = None
     ) -> KnowledgeBase:
         """
         Build complete knowledge base.
@@ -72,29 +103,43 @@ class KnowledgeBaseBuilder:
             api_entries_by_language: APIs grouped by language
             example_entries_by_language: Examples grouped by language
             generation_mode: "standalone" or "integration"
+            timestamp: ISO timestamp recorded in metadata (default: now).
+                Batch callers can pass one timestamp for every build.
 
         Returns:
             KnowledgeBase object
         """
         logger.info(f"Building knowledge base at: {self.output_dir}")
 
+        # Reset index state in case this builder is reused
+        self._api_index = {}
+        self._example_index = {}
+
+        # Content hashes from the previous build, and the ones written now
+        self._previous_hashes = self._load_content_hashes()
+        self._content_hashes: Dict[str, str] = {}
+
         # Create directories
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.api_catalog_dir.mkdir(parents=True, exist_ok=True)
         self.examples_db_dir.mkdir(parents=True, exist_ok=True)
 
         # Build API catalog
-        api_catalog = self._build_api_catalog(api_entries_by_language)
+        api_catalog, apis_by_language = self._build_api_catalog(api_entries_by_language)
 
         # Build examples database
-        examples_db = self._build_examples_db(example_entries_by_language)
+        examples_db, examples_by_language, validated_count = self._build_examples_db(
+            example_entries_by_language
+        )
 
-        # Build metadata
+        # Build metadata from the counts collected while writing
         metadata = self._build_metadata(
             library_overview,
-            api_entries_by_language,
-            example_entries_by_language,
-            generation_mode
+            apis_by_language,
+            examples_by_language,
+            validated_count,
+            generation_mode,
+            timestamp or datetime.now().isoformat()
         )
 
         # Create knowledge base object
@@ -110,6 +155,7 @@ class KnowledgeBaseBuilder:
         self._save_library_overview(library_overview)
         self._save_index(knowledge_base)
         self._save_metadata(metadata)
+        self._save_content_hashes()
 
         logger.info(
             f"Knowledge base complete: "
@@ -122,7 +168,7 @@ class KnowledgeBaseBuilder:
     def _build_api_catalog(
         self,
         api_entries_by_language: Dict[str, List[APIEntry]]
-    ) -> Dict[str, Dict[str, APIEntry]]:
+    ) -> Tuple[Dict[str, Dict[str, APIEntry]], Dict[str, int]]:
         """
         Build API catalog with per-language organization.
 
@@ -132,32 +178,63 @@ class KnowledgeBaseBuilder:
             api_entries_by_language: APIs grouped by language
 
         Returns:
-            Nested dict: {language: {api_id: APIEntry}}
+            Tuple of:
+            - Nested dict: {language: {api_id: APIEntry}}
+            - API count per language (for metadata)
         """
         api_catalog = {}
+        api_counts = {}
 
         for language, apis in api_entries_by_language.items():
+            api_catalog[language] = {api.api_id: api for api in apis}
+            api_counts[language] = len(apis)
+
+            # Light index records, so _save_index never revisits APIEntry objects
+            index_records = {
+                api.api_id: {
+                    "api_id": api.api_id,
+                    "signature": api.signature,
+                    "importance_score": api.importance_score
+                }
+                for api in apis
+            }
+            self._api_index[language] = index_records
+
+            if self.shard_files:
+                shard_path = self.api_catalog_dir / f"{language}.jsonl"
+                locations = self._write_shard(
+                    shard_path,
+                    f"api_catalog/{language}.jsonl",
+                    [(api.api_id, api.model_dump_json()) for api in apis]
+                )
+                for api_id, record in index_records.items():
+                    record.update(locations[api_id])
+                logger.debug(f"Wrote {len(apis)} APIs to shard {shard_path}")
+                continue
+
             language_dir = self.api_catalog_dir / language
             language_dir.mkdir(parents=True, exist_ok=True)
 
-            api_catalog[language] = {}
+            files = []
+            used_names = set()
 
-            for api in apis:
-                # Save individual API file
-                api_file = language_dir / f"{self._safe_filename(api.api_id)}.json"
-                api_data = api.model_dump()
-                api_file.write_text(json.dumps(api_data, indent=2), encoding='utf-8')
+            # One file per distinct API ID (the last entry wins, as in api_catalog)
+            for api in api_catalog[language].values():
+                # Serialize individual API file (written in parallel below)
+                filename = f"{self._unique_filename(api.api_id, used_names)}.json"
+                files.append((language_dir / filename, api.model_dump_json()))
+                index_records[api.api_id]["file"] = f"api_catalog/{language}/{filename}"
 
-                api_catalog[language][api.api_id] = api
+            self._write_files(files)
 
             logger.debug(f"Created {len(apis)} API files for {language}")
 
-        return api_catalog
+        return api_catalog, api_counts
 
     def _build_examples_db(
         self,
         example_entries_by_language: Dict[str, List[ExampleEntry]]
-    ) -> Dict[str, Dict[str, ExampleEntry]]:
+    ) -> Tuple[Dict[str, Dict[str, ExampleEntry]], Dict[str, int], int]:
         """
         Build examples database with per-language organization.
 
@@ -167,65 +244,183 @@ class KnowledgeBaseBuilder:
             example_entries_by_language: Examples grouped by language
 
         Returns:
-            Nested dict: {language: {example_id: ExampleEntry}}
+            Tuple of:
+            - Nested dict: {language: {example_id: ExampleEntry}}
+            - Example count per language (for metadata)
+            - Number of validated examples across all languages
         """
         examples_db = {}
+        example_counts = {}
+        validated_count = 0
 
         for language, examples in example_entries_by_language.items():
-            language_dir = self.examples_db_dir / language
-            language_dir.mkdir(parents=True, exist_ok=True)
-
             examples_db[language] = {}
+            example_counts[language] = len(examples)
 
+            # Serialize every example in one pass, counting validated ones and
+            # picking out only the fields index.json needs
+            records = []
+            index_records = {}
             for example in examples:
-                # Save individual example file
-                example_file = language_dir / f"{example.example_id}.json"
-                example_data = example.model_dump()
-                example_file.write_text(json.dumps(example_data, indent=2), encoding='utf-8')
-
                 examples_db[language][example.example_id] = example
+                records.append((example.example_id, example.model_dump_json()))
+                index_records[example.example_id] = {
+                    "example_id": example.example_id,
+                    "title": example.title,
+                    "complexity": example.complexity,
+                    "apis_used": example.apis_used
+                }
+                validated_count += example.validated
+            self._example_index[language] = index_records
+
+            if self.shard_files:
+                shard_path = self.examples_db_dir / f"{language}.jsonl"
+                locations = self._write_shard(
+                    shard_path,
+                    f"examples_db/{language}.jsonl",
+                    records
+                )
+                for example_id, record in index_records.items():
+                    record.update(locations[example_id])
+                logger.debug(f"Wrote {len(examples)} examples to shard {shard_path}")
+                continue
+
+            language_dir = self.examples_db_dir / language
+            language_dir.mkdir(parents=True, exist_ok=True)
+
+            # Written in parallel
+            self._write_files([
+                (language_dir / f"{example_id}.json", record)
+                for example_id, record in records
+            ])
+            for example_id, record in index_records.items():
+                record["file"] = f"examples_db/{language}/{example_id}.json"
 
             logger.debug(f"Created {len(examples)} example files for {language}")
 
-        return examples_db
+        return examples_db, example_counts, validated_count
+
+    def _write_files(self, files: List[Tuple[Path, str]]):
+        """
+        Write many small files concurrently.
+
+        Files whose content is unchanged since the previous build are skipped.
+        If a path appears more than once, only its last content is written,
+        so concurrent writes never race on one file.
+
+        Args:
+            files: (path, content) pairs to write as UTF-8 text
+        """
+        changed = []
+        for path, content in dict(files).items():
+            data = content.encode('utf-8')
+            if self._content_changed(path, data):
+                changed.append((path, data))
+
+        if not changed:
+            return
+
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+            # Consume the iterator so write errors propagate
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), changed))
+
+        logger.debug(f"Wrote {len(changed)}/{len(files)} changed files")
+
+    def _content_changed(self, path: Path, data: bytes) -> bool:
+        """
+        Record the content hash of a file and check it against the last build.
+
+        Args:
+            path: File about to be written
+            data: Encoded file content
+
+        Returns:
+            True if the file must be (re)written
+        """
+        key = path.relative_to(self.output_dir).as_posix()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        self._content_hashes[key] = digest
+        return self._previous_hashes.get(key) != digest or not path.exists()
+
+    def _load_content_hashes(self) -> Dict[str, str]:
+        """Load the content hash manifest from the previous build, if any."""
+        manifest_path = self.output_dir / CONTENT_HASHES_FILE
+        if not manifest_path.exists():
+            return {}
+
+        try:
+            return json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable content hash manifest {manifest_path}: {e}")
+            return {}
+
+    def _save_content_hashes(self):
+        """Atomically replace the content hash manifest."""
+        manifest_path = self.output_dir / CONTENT_HASHES_FILE
+        tmp_path = manifest_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self._content_hashes), encoding='utf-8')
+        os.replace(tmp_path, manifest_path)
+        logger.debug(f"Saved content hashes: {manifest_path}")
+
+    def _write_shard(
+        self,
+        shard_path: Path,
+        relative_path: str,
+        records: List[Tuple[str, str]]
+    ) -> Dict[str, Dict]:
+        """
+        Write records to a single JSONL shard.
+
+        Args:
+            shard_path: Shard file to write
+            relative_path: Shard path relative to the knowledge base root
+            records: (entry_id, compact JSON) pairs
+
+        Returns:
+            Dict mapping entry_id to its index location fields
+            ({"file", "offset", "length"})
+        """
+        locations = {}
+        chunks = []
+        offset = 0
+
+        for entry_id, record in records:
+            data = record.encode('utf-8')
+            locations[entry_id] = {"file": relative_path, "offset": offset, "length": len(data)}
+            chunks.append(data)
+            offset += len(data) + 1  # Trailing newline
+
+        data = b''.join(chunk + b'\n' for chunk in chunks)
+        if self._content_changed(shard_path, data):
+            shard_path.write_bytes(data)
+        return locations
 
     def _build_metadata(
         self,
         library_overview: LibraryOverview,
-        api_entries_by_language: Dict[str, List[APIEntry]],
-        example_entries_by_language: Dict[str, List[ExampleEntry]],
-        generation_mode: str
+        apis_by_language: Dict[str, int],
+        examples_by_language: Dict[str, int],
+        validated_count: int,
+        generation_mode: str,
+        timestamp: str
     ) -> Dict:
         """
         Build generation metadata.
 
         Args:
             library_overview: Library metadata
-            api_entries_by_language: APIs by language
-            example_entries_by_language: Examples by language
+            apis_by_language: API count per language
+            examples_by_language: Example count per language
+            validated_count: Number of validated examples
             generation_mode: Generation mode
+            timestamp: ISO timestamp of this build
 
         Returns:
             Metadata dictionary
         """
-        apis_by_language = {
-            lang: len(apis)
-            for lang, apis in api_entries_by_language.items()
-        }
-
-        examples_by_language = {
-            lang: len(examples)
-            for lang, examples in example_entries_by_language.items()
-        }
-
-        # Count validated examples (if in integration mode)
-        validated_count = 0
-        for examples in example_entries_by_language.values():
-            validated_count += sum(1 for ex in examples if ex.validated)
-
         return {
             "generation_mode": generation_mode,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "library_name": library_overview.name,
             "library_version": library_overview.version,
             "languages": library_overview.languages,
@@ -240,8 +435,7 @@ class KnowledgeBaseBuilder:
     def _save_library_overview(self, overview: LibraryOverview):
         """Save library overview to JSON."""
         overview_path = self.output_dir / "library_overview.json"
-        overview_data = overview.model_dump()
-        overview_path.write_text(json.dumps(overview_data, indent=2), encoding='utf-8')
+        overview_path.write_text(overview.model_dump_json(indent=2), encoding='utf-8')
         logger.debug(f"Saved library overview: {overview_path}")
 
     def _save_index(self, knowledge_base: KnowledgeBase):
@@ -258,30 +452,13 @@ class KnowledgeBaseBuilder:
             "examples": {}
         }
 
-        # Index APIs
-        for language, apis in knowledge_base.api_catalog.items():
-            index["apis"][language] = [
-                {
-                    "api_id": api_id,
-                    "signature": api.signature,
-                    "importance_score": api.importance_score,
-                    "file": f"api_catalog/{language}/{self._safe_filename(api_id)}.json"
-                }
-                for api_id, api in apis.items()
-            ]
+        # Index APIs (records were built when the catalog was written)
+        for language, index_records in self._api_index.items():
+            index["apis"][language] = list(index_records.values())
 
         # Index examples
-        for language, examples in knowledge_base.examples_db.items():
-            index["examples"][language] = [
-                {
-                    "example_id": example_id,
-                    "title": example.title,
-                    "complexity": example.complexity,
-                    "apis_used": example.apis_used,
-                    "file": f"examples_db/{language}/{example_id}.json"
-                }
-                for example_id, example in examples.items()
-            ]
+        for language, index_records in self._example_index.items():
+            index["examples"][language] = list(index_records.values())
 
         index_path = self.output_dir / "index.json"
         index_path.write_text(json.dumps(index, indent=2), encoding='utf-8')
@@ -303,13 +480,29 @@ class KnowledgeBaseBuilder:
         Returns:
             Safe filename string
         """
-        # Replace special characters with underscores
-        safe = text.replace('.', '_').replace(':', '_').replace('/', '_')
-        safe = safe.replace('\\', '_').replace(' ', '_')
-        # Limit length
-        if len(safe) > 200:
-            safe = safe[:200]
-        return safe
+        # Replace special characters with underscores and limit length
+        return text.translate(_FILENAME_TRANS)[:200]
+
+    def _unique_filename(self, text: str, used_names: Set[str]) -> str:
+        """
+        Convert text to a safe filename not already in used_names.
+
+        Distinct IDs can map to the same safe filename (after character
+        replacement or truncation); later ones get a short hash of the
+        original text appended.
+
+        Args:
+            text: Text to convert
+            used_names: Filenames taken so far in this directory (updated)
+
+        Returns:
+            Safe filename string, unique within used_names
+        """
+        name = self._safe_filename(text)
+        if name in used_names:
+            name = f"{name}_{hashlib.sha256(text.encode('utf-8')).hexdigest()[:8]}"
+        used_names.add(name)
+        return name
 
 
 def build_knowledge_base(
@@ -317,7 +510,9 @@ def build_knowledge_base(
     library_overview: LibraryOverview,
     api_entries_by_language: Dict[str, List[APIEntry]],
     example_entries_by_language: Dict[str, List[ExampleEntry]],
-    generation_mode: str = "standalone"
+    generation_mode: str = "standalone",
+    shard_files: bool = False,
+    timestamp: Optional[str] = None
 ) -> KnowledgeBase:
     """
     Convenience function to build knowledge base.
@@ -328,6 +523,8 @@ def build_knowledge_base(
         api_entries_by_language: APIs grouped by language
         example_entries_by_language: Examples grouped by language
         generation_mode: "standalone" or "integration"
+        shard_files: Pack entries into per-language JSONL shards
+        timestamp: ISO timestamp recorded in metadata (default: now)
 
     Returns:
         KnowledgeBase object
@@ -343,10 +540,11 @@ def build_knowledge_base(
         ... )
         >>> print(f"Built knowledge base with {len(kb.api_catalog['python'])} Python APIs")
     """
-    builder = KnowledgeBaseBuilder(output_dir)
+    builder = KnowledgeBaseBuilder(output_dir, shard_files=shard_files)
     return builder.build(
         library_overview,
         api_entries_by_language,
         example_entries_by_language,
-        generation_mode
+        generation_mode,
+        timestamp
     )
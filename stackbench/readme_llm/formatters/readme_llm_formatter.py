@@ -17,14 +17,26 @@ Structure:
 </ReadMe.LLM>
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TextIO
 from pathlib import Path
+import io
 import logging
+import re
 
 from stackbench.readme_llm.schemas import APIEntry, ExampleEntry, LibraryOverview
 
 logger = logging.getLogger(__name__)
 
+# XML special characters and their escapes (applied in a single pass)
+_XML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;'
+}
+_XML_ESCAPE_RE = re.compile('[&<>"\']')
+
 
 class ReadMeLLMFormatter:
     """
@@ -63,6 +75,15 @@ class ReadMeLLMFormatter:
         self.rules = custom_rules or self.DEFAULT_RULES
         self.max_contexts = max_contexts
 
+        # Escaped rule text per language, filled lazily by _rules_for()
+        self._rules_by_language: Dict[str, List[str]] = {}
+        self._context_description = self._escape_xml(
+            f"The context will be for the {library_overview.name} library. "
+            f"{library_overview.description} "
+            f"The context is organized into different numbered sections using XML tags, "
+            f"each covering a specific API or functionality."
+        )
+
     def format(
         self,
         api_entries: List[APIEntry],
@@ -80,6 +101,29 @@ class ReadMeLLMFormatter:
         Returns:
             XML string for README.LLM
         """
+        with io.StringIO() as buf:
+            self.format_to(buf, api_entries, example_entries, language)
+            return buf.getvalue()
+
+    def format_to(
+        self,
+        fp: TextIO,
+        api_entries: List[APIEntry],
+        example_entries: Dict[str, ExampleEntry],
+        language: Optional[str] = None
+    ):
+        """
+        Write README.LLM XML content to a text stream.
+
+        Same output as format(), but written incrementally so the full
+        document never has to be held in memory.
+
+        Args:
+            fp: Text-mode file object to write to
+            api_entries: List of API catalog entries (should be sorted by importance)
+            example_entries: Dictionary mapping example IDs to ExampleEntry objects
+            language: Optional language filter (if None, uses library_overview.languages[0])
+        """
         if not language:
             language = self.library_overview.languages[0] if self.library_overview.languages else "python"
 
@@ -94,126 +138,143 @@ class ReadMeLLMFormatter:
 
         logger.info(f"Generating README.LLM for {len(language_apis)} APIs ({language})")
 
-        # Build XML
-        xml_lines = ['<ReadMe.LLM>']
+        write = fp.write
+        write('<ReadMe.LLM>\n')
 
         # 1. Rules section
-        xml_lines.append('  <rules>')
-        for i, rule in enumerate(self.rules, 1):
-            # Substitute placeholders
-            rule_text = rule.replace('{library}', self.library_overview.name)
-            rule_text = rule_text.replace('{language}', language)
-            xml_lines.append(f'    Rule number {i}: {self._escape_xml(rule_text)}')
-        xml_lines.append('  </rules>')
-        xml_lines.append('')
+        write('  <rules>\n')
+        for i, rule_text in enumerate(self._rules_for(language), 1):
+            write(f'    Rule number {i}: {rule_text}\n')
+        write('  </rules>\n')
+        write('\n')
 
         # 2. Context description
-        xml_lines.append('  <context_description>')
-        description = (
-            f"The context will be for the {self.library_overview.name} library. "
-            f"{self.library_overview.description} "
-            f"The context is organized into different numbered sections using XML tags, "
-            f"each covering a specific API or functionality."
-        )
-        xml_lines.append(f'    {self._escape_xml(description)}')
-        xml_lines.append('  </context_description>')
-        xml_lines.append('')
+        write('  <context_description>\n')
+        write(f'    {self._context_description}\n')
+        write('  </context_description>\n')
+        write('\n')
 
         # 3. Context sections (one per API)
-        for i, api in enumerate(language_apis, 1):
-            context_xml = self._format_context(i, api, example_entries)
-            xml_lines.append(context_xml)
-            xml_lines.append('')
+        # Select every API's example up front; scores are memoized per example
+        example_scores: Dict[str, tuple] = {}
+        best_examples = [
+            self._select_best_example(api, example_entries, example_scores)
+            for api in language_apis
+        ]
+        for i, (api, example) in enumerate(zip(language_apis, best_examples), 1):
+            self._format_context(i, api, example, fp)
+            write('\n')
+
+        write('</ReadMe.LLM>')
+
+    def _rules_for(self, language: str) -> List[str]:
+        """
+        Get rules with placeholders substituted for a language.
 
-        xml_lines.append('</ReadMe.LLM>')
+        Args:
+            language: Language substituted for {language}
 
-        return '\n'.join(xml_lines)
+        Returns:
+            XML-escaped rule texts (cached per language)
+        """
+        rules = self._rules_by_language.get(language)
+        if rules is None:
+            rules = [
+                self._escape_xml(
+                    rule.replace('{library}', self.library_overview.name)
+                    .replace('{language}', language)
+                )
+                for rule in self.rules
+            ]
+            self._rules_by_language[language] = rules
+        return rules
 
     def _format_context(
         self,
         context_num: int,
         api: APIEntry,
-        example_entries: Dict[str, ExampleEntry]
-    ) -> str:
+        example: Optional[ExampleEntry],
+        fp: TextIO
+    ):
         """
         Format a single context section.
 
         Args:
             context_num: Context number (1-indexed)
             api: APIEntry object
-            example_entries: Dictionary of example entries
-
-        Returns:
-            XML string for context section
+            example: Best example for this API (from _select_best_example)
+            fp: Text stream the context section is written to
         """
-        lines = [f'  <context_{context_num}>']
+        write = fp.write
+        esc = self._escape_xml
+        tag = f'context_{context_num}'
+        tags = api.tags
+        parameters = api.parameters
+        returns = api.returns
+
+        write(f'  <{tag}>\n')
 
         # Description
-        lines.append(f'    <context_{context_num}_description>')
-        lines.append(f'      {self._escape_xml(api.description)}')
+        write(f'    <{tag}_description>\n')
+        write(f'      {esc(api.description)}\n')
 
         # Add usage information if available
-        if api.tags:
-            tags_str = ', '.join(api.tags)
-            lines.append(f'      Tags: {self._escape_xml(tags_str)}')
+        if tags:
+            write(f"      Tags: {esc(', '.join(tags))}\n")
 
-        lines.append(f'    </context_{context_num}_description>')
+        write(f'    </{tag}_description>\n')
 
         # Function signature
-        lines.append(f'    <context_{context_num}_function>')
-        lines.append(f'      API: {self._escape_xml(api.api_id)}')
-        lines.append(f'      Signature: {self._escape_xml(api.signature)}')
+        write(f'    <{tag}_function>\n')
+        write(f'      API: {esc(api.api_id)}\n')
+        write(f'      Signature: {esc(api.signature)}\n')
 
         # Add parameter details if available
-        if api.parameters:
-            lines.append('      Parameters:')
-            for param in api.parameters:
+        if parameters:
+            write('      Parameters:\n')
+            for param in parameters:
                 param_desc = f"        - {param.name} ({param.type})"
                 if not param.required:
                     param_desc += f", optional, default: {param.default}"
                 param_desc += f": {param.description}"
-                lines.append(self._escape_xml(param_desc))
+                write(f'{esc(param_desc)}\n')
 
         # Add return type if available
-        if api.returns:
-            lines.append(f"      Returns: {self._escape_xml(api.returns.get('type', 'unknown'))} - {self._escape_xml(api.returns.get('description', ''))}")
+        if returns:
+            write(f"      Returns: {esc(returns.get('type', 'unknown'))} - {esc(returns.get('description', ''))}\n")
 
-        lines.append(f'    </context_{context_num}_function>')
+        write(f'    </{tag}_function>\n')
 
         # Example
-        lines.append(f'    <context_{context_num}_example>')
-
-        # Get best example for this API
-        example = self._select_best_example(api, example_entries)
+        write(f'    <{tag}_example>\n')
 
         if example:
-            lines.append(f'      {self._escape_xml(example.title)}')
-            lines.append('')
-            # Format code with proper indentation
-            code_lines = example.code.split('\n')
-            for code_line in code_lines:
-                lines.append(f'      {self._escape_xml(code_line)}')
+            write(f'      {esc(example.title)}\n')
+            write('\n')
+            # Format code with proper indentation (escape the block once,
+            # then indent every line, including blank ones)
+            code = esc(example.code).replace('\n', '\n      ')
+            write(f'      {code}\n')
 
             # Add complexity indicator
-            lines.append('')
-            lines.append(f'      Complexity: {example.complexity}')
+            write('\n')
+            write(f'      Complexity: {example.complexity}\n')
 
             # Add prerequisites if available
             if example.prerequisites:
-                lines.append(f'      Prerequisites: {self._escape_xml(", ".join(example.prerequisites))}')
+                write(f'      Prerequisites: {esc(", ".join(example.prerequisites))}\n')
         else:
-            lines.append('      # Example not available for this API')
+            write('      # Example not available for this API\n')
 
-        lines.append(f'    </context_{context_num}_example>')
+        write(f'    </{tag}_example>\n')
 
-        lines.append(f'  </context_{context_num}>')
-
-        return '\n'.join(lines)
+        write(f'  </{tag}>\n')
 
     def _select_best_example(
         self,
         api: APIEntry,
-        example_entries: Dict[str, ExampleEntry]
+        example_entries: Dict[str, ExampleEntry],
+        score_cache: Optional[Dict[str, tuple]] = None
     ) -> Optional[ExampleEntry]:
         """
         Select the best example for an API.
@@ -226,6 +287,8 @@ class ReadMeLLMFormatter:
         Args:
             api: APIEntry object
             example_entries: Dictionary of example entries
+            score_cache: Optional dict memoizing scores by example ID, shared
+                across APIs whose example pools overlap
 
         Returns:
             Best ExampleEntry or None if no examples
@@ -243,17 +306,23 @@ class ReadMeLLMFormatter:
         if not candidates:
             return None
 
-        # Sort by preference
-        def score_example(ex: ExampleEntry) -> tuple:
-            return (
-                ex.validated,  # Validated first
-                ex.complexity == 'beginner',  # Beginner examples preferred
-                ex.is_complete,  # Complete examples preferred
-                -len(ex.code)  # Shorter examples preferred (tie-breaker)
-            )
+        if score_cache is None:
+            score_cache = {}
 
-        candidates.sort(key=score_example, reverse=True)
-        return candidates[0]
+        # Pick by preference
+        def score_example(ex: ExampleEntry) -> tuple:
+            score = score_cache.get(ex.example_id)
+            if score is None:
+                score = (
+                    ex.validated,  # Validated first
+                    ex.complexity == 'beginner',  # Beginner examples preferred
+                    ex.is_complete,  # Complete examples preferred
+                    -len(ex.code)  # Shorter examples preferred (tie-breaker)
+                )
+                score_cache[ex.example_id] = score
+            return score
+
+        return max(candidates, key=score_example)
 
     def _escape_xml(self, text: str) -> str:
         """
@@ -268,19 +337,11 @@ class ReadMeLLMFormatter:
         if not text:
             return ""
 
-        replacements = {
-            '&': '&amp;',
-            '<': '&lt;',
-            '>': '&gt;',
-            '"': '&quot;',
-            "'": '&apos;'
-        }
-
-        result = text
-        for char, replacement in replacements.items():
-            result = result.replace(char, replacement)
+        # Most signatures, IDs and code lines need no escaping at all
+        if not _XML_ESCAPE_RE.search(text):
+            return text
 
-        return result
+        return _XML_ESCAPE_RE.sub(lambda match: _XML_ESCAPES[match.group(0)], text)
 
     def save(self, output_path: Path, content: str):
         """
@@ -341,3 +402,58 @@ def generate_readme_llm(
     formatter.save(output_path, content)
 
     return content
+
+
+def write_readme_llm(
+    library_overview: LibraryOverview,
+    api_entries: List[APIEntry],
+    example_entries: Dict[str, ExampleEntry],
+    output_path: Path,
+    language: Optional[str] = None,
+    max_contexts: int = 50,
+    custom_rules: Optional[List[str]] = None
+) -> Path:
+    """
+    Generate README.LLM by streaming it to disk.
+
+    Like generate_readme_llm(), but the XML goes straight to output_path
+    through a buffered writer and is never built in memory, so the content
+    is not returned.
+
+    Args:
+        library_overview: Library metadata
+        api_entries: List of API catalog entries
+        example_entries: Dictionary of example entries
+        output_path: Where to save README.LLM
+        language: Optional language filter
+        max_contexts: Maximum API contexts to include
+        custom_rules: Optional custom rules
+
+    Returns:
+        Path of the written README.LLM
+
+    Example:
+        >>> from pathlib import Path
+        >>> readme_path = write_readme_llm(
+        ...     overview,
+        ...     apis,
+        ...     examples,
+        ...     Path("data/run_123/readme_llm/README.LLM"),
+        ...     language="python",
+        ...     max_contexts=50
+        ... )
+    """
+    formatter = ReadMeLLMFormatter(
+        library_overview=library_overview,
+        custom_rules=custom_rules,
+        max_contexts=max_contexts
+    )
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        formatter.format_to(f, api_entries, example_entries, language)
+
+    logger.info(f"Saved README.LLM to {output_path} ({output_path.stat().st_size} bytes)")
+
+    return output_path
@@ -6,12 +6,19 @@ programmatically or from a Claude Code agent. It ties together all
 the extraction, introspection, matching, and formatting components.
 """
 
+import os
+import re
 import uuid
+import shutil
 from pathlib import Path
-from typing import List, Dict, Optional, Literal
+from typing import List, Dict, Optional, Literal, Tuple, Type, TypeVar
 from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from pydantic import BaseModel, TypeAdapter
+
 from stackbench.readme_llm.utils import scan_documentation
 from stackbench.readme_llm.extractors import (
     detect_languages,
@@ -20,17 +27,35 @@ from stackbench.readme_llm.extractors import (
 )
 from stackbench.readme_llm.introspection import introspect_library
 from stackbench.readme_llm.matchers import match_examples_to_apis
-from stackbench.readme_llm.formatters import generate_readme_llm, build_knowledge_base
+from stackbench.readme_llm.formatters import write_readme_llm, build_knowledge_base
 from stackbench.readme_llm.schemas import (
+    CodeExample,
     LibraryOverview,
     APIEntry,
     ExampleEntry,
+    IntrospectionResult,
     Parameter,
     ReadMeLLMOutput
 )
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Serializes ReadMeLLMOutput straight to UTF-8 bytes
+_OUTPUT_ADAPTER = TypeAdapter(ReadMeLLMOutput)
+
+# Entries are built from our own introspection and extraction output, so
+# they skip pydantic validation unless STACKBENCH_DEBUG=1 is set
+_VALIDATE_ENTRIES = os.environ.get("STACKBENCH_DEBUG") == "1"
+
+
+def _new_entry(model: Type[ModelT], **fields) -> ModelT:
+    """Create a catalog entry, validating only in debug runs."""
+    if _VALIDATE_ENTRIES:
+        return model(**fields)
+    return model.model_construct(**fields)
+
 
 class ReadMeLLMGenerator:
     """
@@ -39,11 +64,15 @@ class ReadMeLLMGenerator:
     Orchestrates the entire generation pipeline:
     1. Scan documentation
     2. Detect/validate languages
-    3. Introspect library
-    4. Extract and match examples
-    5. Generate outputs
+    3. Extract examples (once, for all languages)
+    4. Introspect library per language (overlapping extraction)
+    5. Resolve snippets and match examples (per language)
+    6. Generate outputs
     """
 
+    # API name fragments that suggest an entry point (boosts importance)
+    _KEYWORD_RE = re.compile(r"connect|create|init|open|new")
+
     def __init__(
         self,
         docs_path: Path,
@@ -78,6 +107,9 @@ class ReadMeLLMGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Runs under data/<run_id>/ take their run ID from the directory
+        self._is_data_run = "data/" in str(self.output_dir)
+
         logger.info(f"Initialized README.LLM generator")
         logger.info(f"  Library: {library_name} {library_version}")
         logger.info(f"  Docs: {docs_path}")
@@ -86,7 +118,8 @@ class ReadMeLLMGenerator:
     def generate(
         self,
         output_format: Literal["monolithic", "knowledge_base", "both"] = "both",
-        max_contexts: int = 50
+        max_contexts: int = 50,
+        use_cache: bool = True
     ) -> ReadMeLLMOutput:
         """
         Run complete generation pipeline.
@@ -94,6 +127,8 @@ class ReadMeLLMGenerator:
         Args:
             output_format: Which output(s) to generate
             max_contexts: Maximum API contexts in README.LLM
+            use_cache: Reuse cached introspection results and extracted
+                examples from unchanged documentation files
 
         Returns:
             ReadMeLLMOutput with metadata and paths
@@ -102,6 +137,9 @@ class ReadMeLLMGenerator:
         logger.info("Starting README.LLM Generation")
         logger.info("=" * 80)
 
+        # One timestamp for every artifact of this run
+        run_timestamp = datetime.now().isoformat()
+
         # Step 1: Scan documentation
         logger.info("\n[1/7] Scanning documentation directory...")
         doc_files = scan_documentation(self.docs_path)
@@ -122,73 +160,84 @@ class ReadMeLLMGenerator:
         # Prepare data structures
         api_entries_by_language: Dict[str, List[APIEntry]] = {}
         example_entries_by_language: Dict[str, List[ExampleEntry]] = {}
-        introspection_results = {}
+        example_entries_map_by_language: Dict[str, Dict[str, ExampleEntry]] = {}
+        introspection_results: Dict[str, IntrospectionResult] = {}
+
+        # Steps 3-4: Introspection (mostly subprocess work) and extraction
+        # (file I/O) are independent, so introspection runs in background
+        # threads while examples are extracted
+        with ThreadPoolExecutor(max_workers=len(languages)) as introspection_executor:
+            introspection_futures = {}
+            for language in languages:
+                logger.info(f"\n[4/7] Introspecting {self.library_name} ({language})...")
+                introspection_futures[language] = introspection_executor.submit(
+                    introspect_library,
+                    library_name=self.library_name,
+                    version=self.library_version,
+                    language=language,
+                    use_cache=use_cache
+                )
 
-        # Process each language
-        for language in languages:
-            logger.info(f"\n{'=' * 80}")
-            logger.info(f"Processing Language: {language.upper()}")
-            logger.info(f"{'=' * 80}")
-
-            # Step 3: Introspect library
-            logger.info(f"\n[3/7] Introspecting {self.library_name} ({language})...")
-            introspection = introspect_library(
-                library_name=self.library_name,
-                version=self.library_version,
-                language=language
-            )
-            introspection_results[language] = introspection
-            logger.info(
-                f"Discovered {len(introspection.apis)} APIs "
-                f"({introspection.total_functions} functions, "
-                f"{introspection.total_classes} classes, "
-                f"{introspection.total_methods} methods)"
+            # Step 3: Extract code examples once and group them by language
+            logger.info("\n[3/7] Extracting code examples...")
+            all_examples_dict = extract_code_examples(
+                doc_files,
+                self.docs_path,
+                cache_dir=self.output_dir / ".cache" / "examples" if use_cache else None
             )
 
-            # Step 4: Extract code examples
-            logger.info(f"\n[4/7] Extracting code examples ({language})...")
-            all_examples_dict = extract_code_examples(doc_files, self.docs_path)
-
-            # Flatten and filter by language
-            all_examples = []
-            for examples in all_examples_dict.values():
-                all_examples.extend([ex for ex in examples if ex.language == language])
-
-            logger.info(f"Extracted {len(all_examples)} {language} code examples")
-
-            # Step 5: Resolve snippets
-            logger.info(f"\n[5/7] Resolving snippet includes ({language})...")
-            all_examples = resolve_snippets(all_examples, self.docs_path)
-            snippet_count = sum(1 for ex in all_examples if ex.is_snippet)
-            logger.info(f"Resolved {snippet_count} snippet includes")
-
-            # Step 6: Match examples to APIs
-            logger.info(f"\n[6/7] Matching examples to APIs ({language})...")
-            api_to_examples, example_to_apis, complexity = match_examples_to_apis(
-                all_examples, introspection
-            )
+            for language in languages:
+                introspection = introspection_futures[language].result()
+                introspection_results[language] = introspection
+                logger.info(
+                    "Discovered %d %s APIs (%d functions, %d classes, %d methods)",
+                    len(introspection.apis),
+                    language,
+                    introspection.total_functions,
+                    introspection.total_classes,
+                    introspection.total_methods
+                )
 
-            logger.info(
-                f"Matched {len(example_to_apis)} examples to "
-                f"{len(api_to_examples)} APIs"
-            )
+        examples_by_language: Dict[str, List[CodeExample]] = defaultdict(list)
+        for examples in all_examples_dict.values():
+            for example in examples:
+                examples_by_language[example.language].append(example)
+
+        # Process each language (steps 5-6). Languages are independent, so
+        # multi-language runs fan out over threads; worker processes would
+        # have to pickle the generator, examples and introspection results
+        # for comparatively light matching work.
+        if len(languages) == 1:
+            language = languages[0]
+            results = {
+                language: self._process_language(
+                    language,
+                    examples_by_language[language],
+                    introspection_results[language],
+                    run_timestamp
+                )
+            }
+        else:
+            with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+                futures = {
+                    language: executor.submit(
+                        self._process_language,
+                        language,
+                        examples_by_language[language],
+                        introspection_results[language],
+                        run_timestamp
+                    )
+                    for language in languages
+                }
+                results = {language: future.result() for language, future in futures.items()}
 
-            # Build APIEntry objects
-            api_entries = self._build_api_entries(
-                introspection,
-                api_to_examples,
-                language
-            )
+        for language in languages:
+            api_entries, example_entries = results[language]
             api_entries_by_language[language] = api_entries
-
-            # Build ExampleEntry objects
-            example_entries = self._build_example_entries(
-                all_examples,
-                example_to_apis,
-                complexity,
-                language
-            )
             example_entries_by_language[language] = example_entries
+            example_entries_map_by_language[language] = {
+                ex.example_id: ex for ex in example_entries
+            }
 
         # Step 7: Generate outputs
         logger.info(f"\n[7/7] Generating outputs...")
@@ -200,34 +249,25 @@ class ReadMeLLMGenerator:
         readme_llm_path = None
         if output_format in ("monolithic", "both"):
             readme_llm_path = self.output_dir / "README.LLM"
+            lang_paths = {
+                language: self.output_dir / f"README.LLM.{language}"
+                for language in languages
+            }
             for language in languages:
                 # Generate per-language README.LLM
-                lang_path = self.output_dir / f"README.LLM.{language}"
-                generate_readme_llm(
+                lang_path = lang_paths[language]
+                write_readme_llm(
                     library_overview=library_overview,
                     api_entries=api_entries_by_language[language],
-                    example_entries={
-                        ex.example_id: ex
-                        for ex in example_entries_by_language[language]
-                    },
+                    example_entries=example_entries_map_by_language[language],
                     output_path=lang_path,
                     language=language,
                     max_contexts=max_contexts
                 )
 
-            # Use first language for main README.LLM
-            first_language = languages[0]
-            generate_readme_llm(
-                library_overview=library_overview,
-                api_entries=api_entries_by_language[first_language],
-                example_entries={
-                    ex.example_id: ex
-                    for ex in example_entries_by_language[first_language]
-                },
-                output_path=readme_llm_path,
-                language=first_language,
-                max_contexts=max_contexts
-            )
+            # Main README.LLM is the first language's file; copy it rather
+            # than formatting the same content a second time
+            shutil.copyfile(lang_paths[languages[0]], readme_llm_path)
 
             logger.info(f"Generated README.LLM: {readme_llm_path}")
 
@@ -240,19 +280,20 @@ class ReadMeLLMGenerator:
                 library_overview=library_overview,
                 api_entries_by_language=api_entries_by_language,
                 example_entries_by_language=example_entries_by_language,
-                generation_mode=self.generation_mode
+                generation_mode=self.generation_mode,
+                timestamp=run_timestamp
             )
 
             logger.info(f"Generated knowledge base: {knowledge_base_path}")
 
         # Create output metadata
         output = ReadMeLLMOutput(
-            run_id=self.output_dir.parent.name if "data/" in str(self.output_dir) else "standalone",
+            run_id=self.output_dir.parent.name if self._is_data_run else "standalone",
             library_name=self.library_name,
             library_version=self.library_version,
             languages=languages,
             generation_mode=self.generation_mode,
-            timestamp=datetime.now().isoformat(),
+            timestamp=run_timestamp,
             readme_llm_path=str(readme_llm_path) if readme_llm_path else "",
             knowledge_base_path=str(knowledge_base_path) if knowledge_base_path else "",
             total_apis=sum(len(apis) for apis in api_entries_by_language.values()),
@@ -269,7 +310,8 @@ class ReadMeLLMGenerator:
 
         # Save output metadata
         metadata_path = self.output_dir / "generation_metadata.json"
-        metadata_path.write_text(output.model_dump_json(indent=2), encoding='utf-8')
+        with open(metadata_path, 'wb') as f:
+            f.write(_OUTPUT_ADAPTER.dump_json(output, indent=2))
 
         logger.info("\n" + "=" * 80)
         logger.info("README.LLM Generation Complete!")
@@ -281,6 +323,72 @@ class ReadMeLLMGenerator:
 
         return output
 
+    def _process_language(
+        self,
+        language: str,
+        all_examples: List[CodeExample],
+        introspection: IntrospectionResult,
+        timestamp: str
+    ) -> Tuple[List[APIEntry], List[ExampleEntry]]:
+        """
+        Run steps 5-6 (resolve snippets, match) for one language.
+
+        Touches no shared state, so languages can run on separate threads.
+
+        Args:
+            language: Language to process
+            all_examples: Extracted code examples for this language
+            introspection: Introspection result for this language
+            timestamp: ISO timestamp of this run, recorded on every example
+
+        Returns:
+            Tuple of (api_entries, example_entries)
+        """
+        # Per-language progress lines use lazy %-formatting, so quiet runs
+        # skip building them
+        logger.info("\n%s", "=" * 80)
+        logger.info("Processing Language: %s", language.upper())
+        logger.info("%s", "=" * 80)
+
+        logger.info("Extracted %d %s code examples", len(all_examples), language)
+
+        # Step 5: Resolve snippets
+        logger.info("\n[5/7] Resolving snippet includes (%s)...", language)
+        all_examples = resolve_snippets(all_examples, self.docs_path)
+        if logger.isEnabledFor(logging.INFO):
+            snippet_count = sum(1 for ex in all_examples if ex.is_snippet)
+            logger.info("Resolved %d snippet includes", snippet_count)
+
+        # Step 6: Match examples to APIs
+        logger.info("\n[6/7] Matching examples to APIs (%s)...", language)
+        api_to_examples, example_to_apis, complexity = match_examples_to_apis(
+            all_examples, introspection
+        )
+
+        logger.info(
+            "Matched %d examples to %d APIs",
+            len(example_to_apis),
+            len(api_to_examples)
+        )
+
+        # Build APIEntry objects
+        api_entries = self._build_api_entries(
+            introspection,
+            api_to_examples,
+            language
+        )
+
+        # Build ExampleEntry objects
+        example_entries = self._build_example_entries(
+            all_examples,
+            example_to_apis,
+            complexity,
+            language,
+            timestamp
+        )
+
+        return api_entries, example_entries
+
     def _build_api_entries(
         self,
         introspection,
@@ -292,9 +400,10 @@ class ReadMeLLMGenerator:
 
         for api_data in introspection.apis:
             api_id = api_data["api"]
+            examples = api_to_examples.get(api_id, [])
 
             # Calculate importance score (heuristic)
-            importance = self._calculate_importance(api_data, api_to_examples.get(api_id, []))
+            importance = self._calculate_importance(api_data, examples)
 
             # Extract parameters
             parameters = []
@@ -302,14 +411,15 @@ class ReadMeLLMGenerator:
             # In a full implementation, would parse from introspection data
 
             # Create APIEntry
-            entry = APIEntry(
+            entry = _new_entry(
+                APIEntry,
                 api_id=api_id,
                 language=language,
                 signature=api_data.get("signature", ""),
                 description=f"API: {api_id}",  # Could extract from docstrings
                 parameters=parameters,
                 returns=None,  # Could extract from introspection
-                examples=api_to_examples.get(api_id, []),
+                examples=examples,
                 importance_score=importance,
                 tags=[api_data.get("type", "function")],
                 related_apis=[],
@@ -326,13 +436,15 @@ class ReadMeLLMGenerator:
         examples: List,
         example_to_apis: Dict[str, List[str]],
         complexity: Dict[str, str],
-        language: str
+        language: str,
+        timestamp: str
     ) -> List[ExampleEntry]:
         """Build ExampleEntry objects from code examples."""
         example_entries = []
 
         for example in examples:
-            entry = ExampleEntry(
+            entry = _new_entry(
+                ExampleEntry,
                 example_id=example.example_id,
                 title=f"Example: {example.example_id}",
                 code=example.code,
@@ -347,10 +459,11 @@ class ReadMeLLMGenerator:
                 execution_context={
                     "library_version": self.library_version,
                     "generation_method": self.generation_mode,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 },
                 source_file=example.source_file,
-                line_number=example.line_number
+                line_number=example.line_number,
+                is_complete=example.is_complete
             )
 
             example_entries.append(entry)
@@ -380,7 +493,7 @@ class ReadMeLLMGenerator:
 
         # Boost for common patterns in name
         api_name = api_data["api"].lower()
-        if any(word in api_name for word in ["connect", "create", "init", "open", "new"]):
+        if self._KEYWORD_RE.search(api_name):
             score += 0.1
 
         # Clamp to 0.0-1.0
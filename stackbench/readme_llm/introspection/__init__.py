@@ -1,5 +1,5 @@
 """Introspection components for library API discovery."""
 
-from .runner import IntrospectionRunner, introspect_library
+from .runner import IntrospectionRunner, introspect_library, introspect_libraries
 
-__all__ = ["IntrospectionRunner", "introspect_library"]
+__all__ = ["IntrospectionRunner", "introspect_library", "introspect_libraries"]
@@ -6,21 +6,113 @@ for discovering library APIs across Python, TypeScript, JavaScript, Go, and Rust
 
 Creates isolated environments, installs libraries, runs templates, and
 parses standardized JSON output.
+
+Results are cached per (library, version, backend, modules, template hash), in
+memory and on disk under ~/.cache/stackbench/introspect/, since a pinned release
+always introspects to the same API surface; editing a template invalidates its
+results, and runs that find no APIs are never cached. TypeScript and JavaScript share one
+backend, so a run covering both introspects the npm package once.
+
+Installed Python venvs and npm projects are kept under the same directory
+(envs/), so re-introspecting a library skips environment setup. Set
+STACKBENCH_INTROSPECT_CACHE to move the cache.
 """
 
+import os
+import re
 import json
 import subprocess
 import tempfile
 import shutil
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows: environment setup falls back to in-process locks only
+    fcntl = None
+
 from stackbench.readme_llm.schemas import IntrospectionResult
 
 logger = logging.getLogger(__name__)
 
+# On-disk cache of introspection results (and envs/ for installed environments)
+INTROSPECTION_CACHE_DIR = Path(
+    os.environ.get("STACKBENCH_INTROSPECT_CACHE", Path.home() / ".cache" / "stackbench" / "introspect")
+)
+
+# Marker written once an environment is fully installed
+ENV_READY_MARKER = ".ready"
+
+# Executables directory and suffix inside a venv
+_VENV_BIN = "Scripts" if os.name == "nt" else "bin"
+_EXE_SUFFIX = ".exe" if os.name == "nt" else ""
+
+# Timeouts (seconds) for package installs and for running a template
+INSTALL_TIMEOUT = int(os.environ.get("STACKBENCH_INSTALL_TIMEOUT", 300))
+TEMPLATE_TIMEOUT = int(os.environ.get("STACKBENCH_TEMPLATE_TIMEOUT", 120))
+
+# Attempts for an install that fails with a transient network error
+INSTALL_ATTEMPTS = 3
+
+# Install errors worth retrying (network blips rather than bad specs)
+TRANSIENT_INSTALL_ERRORS = (
+    "ETIMEDOUT",
+    "ECONNRESET",
+    "ECONNREFUSED",
+    "EAI_AGAIN",
+    "ERR_SOCKET_TIMEOUT",
+    "Connection reset",
+    "Connection refused",
+    "Read timed out",
+    "timed out",
+    "Temporary failure in name resolution",
+    "TLS handshake timeout",
+    "spurious network error",
+)
+
+# Bundled introspection templates, and the template each backend runs
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "introspection_templates"
+_BACKEND_TEMPLATES = {
+    'python': 'python_introspect.py',
+    'typescript': 'typescript_introspect.ts',
+    'go': 'go_introspect.go',
+    'rust': 'rust_introspect.rs',
+}
+
+# Languages introspected by another language's backend
+_BACKEND_LANGUAGES = {'javascript': 'typescript'}
+
+# Introspection method reported by each backend's template
+_INTROSPECTION_METHODS = {
+    'python': 'inspect.signature',
+    'typescript': 'typescript-compiler-api',
+    'go': 'go/parser',
+    'rust': 'syn',
+}
+
+# Cache key: (library_name, version, backend, sorted modules, template hash)
+IntrospectionKey = Tuple[str, str, str, Tuple[str, ...], str]
+
+# In-process cache of introspection results
+_introspection_cache: Dict[IntrospectionKey, IntrospectionResult] = {}
+
+# Per-key locks, so concurrent callers for one key introspect only once
+_introspection_locks: Dict[IntrospectionKey, threading.Lock] = {}
+_introspection_locks_guard = threading.Lock()
+
+# Per-directory locks for environment setup within this process (flock()
+# covers other processes, where available)
+_env_locks: Dict[Path, threading.Lock] = {}
+_env_locks_guard = threading.Lock()
+
 
 class IntrospectionRunner:
     """
@@ -33,23 +125,30 @@ class IntrospectionRunner:
     - Rust: Uses cargo, runs rust_introspect.rs (Phase 2)
     """
 
-    def __init__(self, templates_dir: Optional[Path] = None):
+    def __init__(self, templates_dir: Optional[Path] = None, env_cache_dir: Optional[Path] = None):
         """
         Initialize introspection runner.
 
         Args:
             templates_dir: Directory containing introspection templates
                          (default: stackbench/introspection_templates/)
+            env_cache_dir: Directory for reusable installed environments
+                         (default: <INTROSPECTION_CACHE_DIR>/envs)
         """
         if templates_dir is None:
             # Default to templates directory in stackbench
-            templates_dir = Path(__file__).parent.parent.parent / "introspection_templates"
+            templates_dir = TEMPLATES_DIR
 
         self.templates_dir = Path(templates_dir).resolve()
 
         if not self.templates_dir.exists():
             raise ValueError(f"Templates directory not found: {self.templates_dir}")
 
+        self.env_cache_dir = Path(env_cache_dir) if env_cache_dir else INTROSPECTION_CACHE_DIR / "envs"
+
+        # Scratch projects go on RAM-backed storage where available
+        self._tmpdir_base = os.environ.get("STACKBENCH_TMPDIR") or self._default_tmpdir_base()
+
         logger.debug(f"Using introspection templates from: {self.templates_dir}")
 
     def introspect_library(
@@ -76,29 +175,41 @@ class IntrospectionRunner:
             RuntimeError: If introspection fails
         """
         logger.info(f"Starting introspection: {library_name} {version} ({language})")
+        introspected_at = datetime.now().isoformat()
 
-        # Dispatch to language-specific handler
-        if language == 'python':
-            return self._introspect_python(library_name, version, modules)
-        elif language in ('typescript', 'javascript'):
-            return self._introspect_typescript(library_name, version, modules)
-        elif language == 'go':
-            return self._introspect_go(library_name, version, modules)
-        elif language == 'rust':
-            return self._introspect_rust(library_name, version, modules)
-        else:
+        backend = _BACKEND_LANGUAGES.get(language, language)
+        if backend not in _INTROSPECTION_METHODS:
             raise ValueError(f"Unsupported language: {language}")
 
+        # Dispatch to language-specific handler; each one prepares its
+        # environment and returns the template's parsed output
+        handler = getattr(self, f"_introspect_{backend}")
+        output_data = handler(library_name, version, modules)
+
+        by_type = output_data.get("by_type", {})
+        return IntrospectionResult(
+            language=output_data.get("language", backend),
+            library_name=library_name,
+            library_version=version,
+            apis=output_data.get("apis", []),
+            timestamp=introspected_at,
+            introspection_method=_INTROSPECTION_METHODS[backend],
+            total_functions=by_type.get("function", 0),
+            total_classes=by_type.get("class", 0),
+            total_methods=by_type.get("method", 0)
+        )
+
     def _introspect_python(
         self,
         library_name: str,
         version: str,
         modules: Optional[List[str]] = None
-    ) -> IntrospectionResult:
+    ) -> Dict[str, Any]:
         """
         Introspect Python library using python_introspect.py template.
 
-        Creates venv, installs library, runs introspection.
+        Creates venv and installs library (reused on later calls), then runs
+        introspection.
 
         Args:
             library_name: Python package name
@@ -106,92 +217,73 @@ class IntrospectionRunner:
             modules: Optional modules to introspect (default: [library_name])
 
         Returns:
-            IntrospectionResult
+            Parsed template output
         """
         template_path = self.templates_dir / "python_introspect.py"
         if not template_path.exists():
             raise FileNotFoundError(f"Python template not found: {template_path}")
 
-        # Create temporary directory for isolated environment
-        with tempfile.TemporaryDirectory(prefix="readme_llm_python_") as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            logger.debug(f"Created temporary environment: {tmpdir}")
-
-            # Create virtual environment
-            venv_path = tmpdir_path / "venv"
-            logger.debug("Creating Python virtual environment...")
-            subprocess.run(
-                ["python3", "-m", "venv", str(venv_path)],
-                check=True,
-                capture_output=True
-            )
-
-            # Determine pip and python paths in venv
-            if subprocess.run(["uname"], capture_output=True).stdout.decode().strip() == "Darwin" or \
-               subprocess.run(["uname"], capture_output=True).stdout.decode().startswith("Linux"):
-                pip_path = venv_path / "bin" / "pip"
-                python_path = venv_path / "bin" / "python"
-            else:  # Windows
-                pip_path = venv_path / "Scripts" / "pip.exe"
-                python_path = venv_path / "Scripts" / "python.exe"
-
-            # Install library
-            package_spec = f"{library_name}=={version}"
-            logger.info(f"Installing {package_spec}...")
-            result = subprocess.run(
-                [str(pip_path), "install", package_spec],
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to install {package_spec}: {result.stderr}")
-
-            # Run introspection template
-            modules_args = modules or [library_name]
-            cmd = [str(python_path), str(template_path), library_name, version] + modules_args
-
-            logger.debug(f"Running introspection: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError(f"Introspection failed: {result.stderr}")
-
-            # Parse JSON output
-            try:
-                output_data = json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse introspection output: {result.stdout[:500]}")
-                raise RuntimeError(f"Invalid JSON output from introspection: {e}")
-
-            # Convert to IntrospectionResult
-            return IntrospectionResult(
-                language="python",
-                library_name=library_name,
-                library_version=version,
-                apis=output_data.get("apis", []),
-                timestamp=datetime.now().isoformat(),
-                introspection_method="inspect.signature",
-                total_functions=output_data.get("by_type", {}).get("function", 0),
-                total_classes=output_data.get("by_type", {}).get("class", 0),
-                total_methods=output_data.get("by_type", {}).get("method", 0)
-            )
+        # Reusable environment for this library version
+        env_dir = self._env_dir("python", library_name, version)
+        venv_path = env_dir / "venv"
+
+        # Determine pip and python paths in venv
+        pip_path = venv_path / _VENV_BIN / f"pip{_EXE_SUFFIX}"
+        python_path = venv_path / _VENV_BIN / f"python{_EXE_SUFFIX}"
+
+        package_spec = f"{library_name}=={version}"
+
+        # uv creates venvs and installs far faster than venv + pip, and
+        # shares downloaded wheels across environments
+        uv_path = shutil.which("uv")
+
+        with self._prepared_env(env_dir) as ready:
+            if not ready:
+                # Create virtual environment
+                logger.debug(f"Creating Python virtual environment in {env_dir}...")
+                if uv_path:
+                    venv_cmd = [uv_path, "venv", str(venv_path)]
+                else:
+                    venv_cmd = ["python3", "-m", "venv", str(venv_path)]
+                subprocess.run(venv_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+                # Install library
+                logger.info(f"Installing {package_spec}...")
+                if uv_path:
+                    install_cmd = [uv_path, "pip", "install", "--python", str(python_path), package_spec]
+                else:
+                    # Skip byte-compiling the whole package; only the modules
+                    # the template imports get compiled, on first import
+                    install_cmd = [
+                        str(pip_path), "install", "--no-compile",
+                        "--disable-pip-version-check", "--no-input", package_spec
+                    ]
+                result = self._run_install(install_cmd)
+
+                if result.returncode != 0:
+                    raise RuntimeError(f"Failed to install {package_spec}: {result.stderr}")
+            else:
+                logger.info(f"Reusing installed environment for {package_spec}")
+
+        # Run introspection template
+        modules_args = modules or [library_name]
+        cmd = [str(python_path), str(template_path), library_name, version] + modules_args
+
+        output_data = self._run_template(cmd)
+
+        return output_data
 
     def _introspect_typescript(
         self,
         library_name: str,
         version: str,
         modules: Optional[List[str]] = None
-    ) -> IntrospectionResult:
+    ) -> Dict[str, Any]:
         """
         Introspect TypeScript/JavaScript library.
 
-        Creates npm project, installs library, runs typescript_introspect.ts.
+        Creates npm project and installs library (reused on later calls), then
+        runs typescript_introspect.ts.
 
         Args:
             library_name: NPM package name
@@ -199,91 +291,347 @@ class IntrospectionRunner:
             modules: Optional modules to introspect
 
         Returns:
-            IntrospectionResult
+            Parsed template output
         """
         template_path = self.templates_dir / "typescript_introspect.ts"
         if not template_path.exists():
             raise FileNotFoundError(f"TypeScript template not found: {template_path}")
 
-        # Create temporary npm project
-        with tempfile.TemporaryDirectory(prefix="readme_llm_ts_") as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            logger.debug(f"Created temporary npm project: {tmpdir}")
+        # Reusable npm project for this library version
+        env_dir = self._env_dir("typescript", library_name, version)
+        package_spec = f"{library_name}@{version}"
+
+        with self._prepared_env(env_dir) as ready:
+            if not ready:
+                logger.debug(f"Creating npm project in {env_dir}")
+
+                # Initialize npm project
+                package_json = {
+                    "name": "introspection-temp",
+                    "version": "1.0.0",
+                    "private": True
+                }
+                (env_dir / "package.json").write_text(json.dumps(package_json, indent=2))
+
+                # Install library together with ts-node for running
+                # TypeScript, in a single dependency resolution. Audit and
+                # funding lookups are skipped; the npm cache is tried first.
+                logger.info(f"Installing {package_spec}...")
+                result = self._run_install(
+                    [
+                        "npm", "install", "--no-audit", "--no-fund", "--prefer-offline",
+                        package_spec, "ts-node", "typescript", "@types/node"
+                    ],
+                    cwd=env_dir
+                )
+
+                if result.returncode != 0:
+                    raise RuntimeError(f"Failed to install {package_spec}: {result.stderr}")
+            else:
+                logger.info(f"Reusing installed npm project for {package_spec}")
+
+            # The template has to live inside the project so its require()
+            # resolves the installed package. Link it in (atomically, as
+            # other runs may be reading it) unless it already is.
+            template_link = env_dir / "introspect.ts"
+            if not (template_link.exists() and os.path.samefile(template_path, template_link)):
+                template_tmp = env_dir / f"introspect.ts.{os.getpid()}.{threading.get_ident()}"
+                self._link_or_copy(template_path, template_tmp)
+                os.replace(template_tmp, template_link)
+
+        # Run introspection. The project's own ts-node binary skips npx's
+        # package resolution, and --transpile-only skips type-checking the
+        # template, which dominates ts-node startup.
+        modules_args = modules or []
+        ts_node_path = env_dir / "node_modules" / ".bin" / f"ts-node{'.cmd' if os.name == 'nt' else ''}"
+        ts_node_cmd = [str(ts_node_path)] if ts_node_path.exists() else ["npx", "ts-node"]
+        cmd = ts_node_cmd + ["--transpile-only", "introspect.ts", library_name, version] + modules_args
+
+        output_data = self._run_template(cmd, cwd=env_dir)
+
+        return output_data
+
+    def _rust_template_paths(self, template_path: Path) -> Tuple[Path, Path]:
+        """
+        Get the cached copy of the Rust template and its compiled binary.
 
-            # Initialize npm project
-            package_json = {
-                "name": "introspection-temp",
-                "version": "1.0.0",
-                "private": True
-            }
-            (tmpdir_path / "package.json").write_text(json.dumps(package_json, indent=2))
+        Both live under env_cache_dir/rust_introspect/<template hash>/, so
+        every call (and cargo's script build cache) sees the same path, and
+        editing the template invalidates the cache.
 
-            # Install library
-            package_spec = f"{library_name}@{version}"
-            logger.info(f"Installing {package_spec}...")
-            result = subprocess.run(
-                ["npm", "install", package_spec],
-                cwd=tmpdir_path,
-                capture_output=True,
-                text=True
-            )
+        Args:
+            template_path: Path to rust_introspect.rs
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to install {package_spec}: {result.stderr}")
+        Returns:
+            Tuple of (script_path, binary_path); the binary may not exist yet
+        """
+        template_bytes = template_path.read_bytes()
+        template_hash = hashlib.sha256(template_bytes).hexdigest()[:16]
+        cache_dir = self.env_cache_dir / "rust_introspect" / template_hash
+        script_path = cache_dir / "introspect.rs"
+        binary_path = cache_dir / f"introspect{_EXE_SUFFIX}"
 
-            # Install ts-node for running TypeScript
-            subprocess.run(
-                ["npm", "install", "ts-node", "typescript", "@types/node"],
-                cwd=tmpdir_path,
-                capture_output=True,
-                check=True
-            )
+        if not script_path.exists():
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            script_tmp = script_path.with_name(f"introspect.rs.{os.getpid()}.{threading.get_ident()}.tmp")
+            script_tmp.write_bytes(template_bytes)
+            os.replace(script_tmp, script_path)
 
-            # Copy template to temp directory
-            template_copy = tmpdir_path / "introspect.ts"
-            shutil.copy(template_path, template_copy)
+        return script_path, binary_path
 
-            # Run introspection
-            modules_args = modules or []
-            cmd = ["npx", "ts-node", "introspect.ts", library_name, version] + modules_args
+    def _go_env(self) -> Dict[str, str]:
+        """
+        Get the environment for Go commands.
+
+        GOMODCACHE and GOCACHE point at env_cache_dir, so downloaded modules
+        and compiled packages are reused by every scratch module instead of
+        being fetched and rebuilt per call.
+
+        Returns:
+            Copy of os.environ with the Go cache variables set
+        """
+        return {
+            **os.environ,
+            "GOMODCACHE": str(self.env_cache_dir / "gomodcache"),
+            "GOCACHE": str(self.env_cache_dir / "gocache"),
+            "GOFLAGS": "-mod=mod",
+        }
+
+    def _go_template_binary(self, template_path: Path, go_env: Dict[str, str]) -> Optional[Path]:
+        """
+        Get the compiled Go template, building it on first use.
+
+        The binary lives under env_cache_dir/go_introspect/<template hash>/,
+        so `go run` doesn't have to relink the template on every call.
+
+        Args:
+            template_path: Path to go_introspect.go
+            go_env: Environment for the go command
+
+        Returns:
+            Path to the binary, or None if it could not be built
+        """
+        template_hash = hashlib.sha256(template_path.read_bytes()).hexdigest()[:16]
+        binary_path = self.env_cache_dir / "go_introspect" / template_hash / f"introspect{_EXE_SUFFIX}"
+
+        if binary_path.exists():
+            return binary_path
+
+        # Specs run on threads of one process, so the temp name is per thread
+        binary_path.parent.mkdir(parents=True, exist_ok=True)
+        binary_tmp = binary_path.with_name(f"{binary_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        build_env = {**go_env, "GOFLAGS": ""}
+        result = subprocess.run(
+            ["go", "build", "-o", str(binary_tmp), str(template_path)],
+            cwd=binary_path.parent,
+            env=build_env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        if result.returncode != 0:
+            logger.debug(f"Failed to prebuild Go introspection, falling back to go run: {result.stderr}")
+            binary_tmp.unlink(missing_ok=True)
+            return None
+
+        os.replace(binary_tmp, binary_path)
+        return binary_path
+
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path):
+        """
+        Hardlink src to dst, copying only when linking isn't possible.
+
+        Args:
+            src: Existing file
+            dst: New path (must not exist)
+        """
+        try:
+            os.link(src, dst)
+        except OSError:
+            # Different filesystem (e.g. tmpfs) or no hardlink support
+            shutil.copy(src, dst)
+
+    @staticmethod
+    def _default_tmpdir_base() -> Optional[str]:
+        """
+        Get the default parent for scratch directories.
+
+        Returns /dev/shm (tmpfs) on Linux when writable, so the many small
+        files of a scratch Go/Cargo project never hit the disk; otherwise
+        None (the system temp directory).
+        """
+        shm = Path("/dev/shm")
+        if shm.is_dir() and os.access(shm, os.W_OK):
+            return str(shm)
+        return None
+
+    def _run_install(
+        self,
+        cmd: List[str],
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a package install command, retrying transient network failures.
+
+        Failures whose stderr matches TRANSIENT_INSTALL_ERRORS (and
+        timeouts) are retried up to INSTALL_ATTEMPTS times with exponential
+        backoff; anything else, like an unknown package, returns at once.
+
+        Args:
+            cmd: Install command to run
+            cwd: Working directory
+            env: Environment for the command
+
+        Returns:
+            CompletedProcess of the last attempt (stderr captured as text)
 
+        Raises:
+            RuntimeError: If the install keeps timing out
+        """
+        for attempt in range(INSTALL_ATTEMPTS):
+            last_attempt = attempt == INSTALL_ATTEMPTS - 1
+            try:
+                result = subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    env=env,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=INSTALL_TIMEOUT
+                )
+            except subprocess.TimeoutExpired:
+                if last_attempt:
+                    raise RuntimeError(f"Install timed out after {INSTALL_TIMEOUT}s: {' '.join(cmd)}")
+                logger.warning(f"Install timed out, retrying ({attempt + 1}/{INSTALL_ATTEMPTS}): {' '.join(cmd)}")
+            else:
+                transient = result.returncode != 0 and any(
+                    marker in result.stderr for marker in TRANSIENT_INSTALL_ERRORS
+                )
+                if not transient or last_attempt:
+                    return result
+                logger.warning(f"Install hit a network error, retrying ({attempt + 1}/{INSTALL_ATTEMPTS}): {' '.join(cmd)}")
+
+            time.sleep(2 ** attempt)
+
+        return result
+
+    def _run_template(self, cmd: List[str], cwd: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Run an introspection template and parse its JSON output.
+
+        stdout goes to an anonymous temporary file and is parsed from there,
+        so large API surfaces are never held in memory as a bytes buffer
+        plus a decoded string.
+
+        Args:
+            cmd: Command to run
+            cwd: Working directory
+
+        Returns:
+            Parsed JSON output
+
+        Raises:
+            RuntimeError: If the template fails or its output is not JSON
+        """
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Running introspection: {' '.join(cmd)}")
+
+        with tempfile.TemporaryFile() as stdout_file:
             result = subprocess.run(
                 cmd,
-                cwd=tmpdir_path,
-                capture_output=True,
+                cwd=cwd,
+                stdout=stdout_file,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=120
+                timeout=TEMPLATE_TIMEOUT
             )
 
             if result.returncode != 0:
                 raise RuntimeError(f"Introspection failed: {result.stderr}")
 
             # Parse JSON output
+            stdout_file.seek(0)
             try:
-                output_data = json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse output: {result.stdout[:500]}")
-                raise RuntimeError(f"Invalid JSON output: {e}")
-
-            return IntrospectionResult(
-                language=output_data.get("language", "typescript"),
-                library_name=library_name,
-                library_version=version,
-                apis=output_data.get("apis", []),
-                timestamp=datetime.now().isoformat(),
-                introspection_method="typescript-compiler-api",
-                total_functions=output_data.get("by_type", {}).get("function", 0),
-                total_classes=output_data.get("by_type", {}).get("class", 0),
-                total_methods=output_data.get("by_type", {}).get("method", 0)
-            )
+                return json.load(stdout_file)
+            except ValueError as e:
+                stdout_file.seek(0)
+                head = stdout_file.read(500).decode('utf-8', errors='replace')
+                logger.error(f"Failed to parse introspection output: {head}")
+                raise RuntimeError(f"Invalid JSON output from introspection: {e}")
+
+    def _env_dir(self, language: str, library_name: str, version: str) -> Path:
+        """
+        Get the reusable environment directory for a library version.
+
+        Args:
+            language: Introspection backend (python, typescript)
+            library_name: Library name
+            version: Library version
+
+        Returns:
+            Directory under env_cache_dir (may not exist yet)
+        """
+        key = hashlib.sha256(f"{language}|{library_name}|{version}".encode('utf-8')).hexdigest()[:16]
+        return self.env_cache_dir / f"{language}-{key}"
+
+    @contextmanager
+    def _prepared_env(self, env_dir: Path):
+        """
+        Hold the setup lock for a reusable environment.
+
+        Yields whether the environment is already installed. If not, the
+        directory is (re)created empty for the caller to install into, and
+        marked ready once the block completes; if the block raises, the
+        partial environment is removed.
+
+        A per-directory thread lock serializes setup within this process, and
+        a sibling .lock file is flock()ed (where available) so concurrent
+        processes never install into the same directory either.
+
+        Args:
+            env_dir: Environment directory from _env_dir()
+
+        Yields:
+            True if the environment was already installed
+        """
+        env_dir.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = env_dir.with_name(f"{env_dir.name}.lock")
+
+        with _env_locks_guard:
+            thread_lock = _env_locks.setdefault(env_dir, threading.Lock())
+
+        with thread_lock, open(lock_path, 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            ready_marker = env_dir / ENV_READY_MARKER
+            ready = ready_marker.exists()
+
+            if not ready:
+                # Leftovers of an interrupted install are not trustworthy
+                shutil.rmtree(env_dir, ignore_errors=True)
+                env_dir.mkdir(parents=True)
+
+            try:
+                yield ready
+            except BaseException:
+                if not ready:
+                    shutil.rmtree(env_dir, ignore_errors=True)
+                raise
+
+            if not ready:
+                ready_marker.touch()
 
     def _introspect_go(
         self,
         library_name: str,
         version: str,
         modules: Optional[List[str]] = None
-    ) -> IntrospectionResult:
+    ) -> Dict[str, Any]:
         """
         Introspect Go library using go_introspect.go template.
 
@@ -295,84 +643,60 @@ class IntrospectionRunner:
             modules: Optional packages to introspect
 
         Returns:
-            IntrospectionResult
+            Parsed template output
         """
         template_path = self.templates_dir / "go_introspect.go"
         if not template_path.exists():
             raise FileNotFoundError(f"Go template not found: {template_path}")
 
         # Create temporary Go module
-        with tempfile.TemporaryDirectory(prefix="readme_llm_go_") as tmpdir:
+        with tempfile.TemporaryDirectory(prefix="readme_llm_go_", dir=self._tmpdir_base) as tmpdir:
             tmpdir_path = Path(tmpdir)
             logger.debug(f"Created temporary Go module: {tmpdir}")
 
+            go_env = self._go_env()
+
             # Initialize Go module
             logger.debug("Initializing Go module...")
             subprocess.run(
                 ["go", "mod", "init", "introspection-temp"],
                 cwd=tmpdir_path,
+                env=go_env,
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
 
             # Install library
             module_spec = f"{library_name}@{version}"
             logger.info(f"Installing {module_spec}...")
-            result = subprocess.run(
-                ["go", "get", module_spec],
-                cwd=tmpdir_path,
-                capture_output=True,
-                text=True
-            )
+            result = self._run_install(["go", "get", module_spec], cwd=tmpdir_path, env=go_env)
 
             if result.returncode != 0:
                 raise RuntimeError(f"Failed to install {module_spec}: {result.stderr}")
 
-            # Copy template to temp directory
-            template_copy = tmpdir_path / "introspect.go"
-            shutil.copy(template_path, template_copy)
-
-            # Run introspection
+            # Run introspection. The template only needs the standard
+            # library, so a prebuilt binary can parse any module's sources.
             modules_args = modules or ["."]
-            cmd = ["go", "run", "introspect.go", library_name, version] + modules_args
+            binary_path = self._go_template_binary(template_path, go_env)
 
-            logger.debug(f"Running introspection: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                cwd=tmpdir_path,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            if binary_path is not None:
+                cmd = [str(binary_path), library_name, version] + modules_args
+            else:
+                # go run needs the file inside the module
+                self._link_or_copy(template_path, tmpdir_path / "introspect.go")
+                cmd = ["go", "run", "introspect.go", library_name, version] + modules_args
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Introspection failed: {result.stderr}")
+            output_data = self._run_template(cmd, cwd=tmpdir_path)
 
-            # Parse JSON output
-            try:
-                output_data = json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse output: {result.stdout[:500]}")
-                raise RuntimeError(f"Invalid JSON output: {e}")
-
-            return IntrospectionResult(
-                language="go",
-                library_name=library_name,
-                library_version=version,
-                apis=output_data.get("apis", []),
-                timestamp=datetime.now().isoformat(),
-                introspection_method="go/parser",
-                total_functions=output_data.get("by_type", {}).get("function", 0),
-                total_classes=output_data.get("by_type", {}).get("class", 0),
-                total_methods=output_data.get("by_type", {}).get("method", 0)
-            )
+            return output_data
 
     def _introspect_rust(
         self,
         library_name: str,
         version: str,
         modules: Optional[List[str]] = None
-    ) -> IntrospectionResult:
+    ) -> Dict[str, Any]:
         """
         Introspect Rust crate using rust_introspect.rs template.
 
@@ -384,14 +708,14 @@ class IntrospectionRunner:
             modules: Optional source files to introspect
 
         Returns:
-            IntrospectionResult
+            Parsed template output
         """
         template_path = self.templates_dir / "rust_introspect.rs"
         if not template_path.exists():
             raise FileNotFoundError(f"Rust template not found: {template_path}")
 
         # Create temporary Cargo project
-        with tempfile.TemporaryDirectory(prefix="readme_llm_rust_") as tmpdir:
+        with tempfile.TemporaryDirectory(prefix="readme_llm_rust_", dir=self._tmpdir_base) as tmpdir:
             tmpdir_path = Path(tmpdir)
             logger.debug(f"Created temporary Rust project: {tmpdir}")
 
@@ -401,7 +725,8 @@ class IntrospectionRunner:
                 ["cargo", "init", "--name", "introspection-temp"],
                 cwd=tmpdir_path,
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
 
             # Add library dependency to Cargo.toml
@@ -412,97 +737,78 @@ class IntrospectionRunner:
 
             # Install dependencies
             logger.info(f"Installing {library_name} {version}...")
-            result = subprocess.run(
-                ["cargo", "fetch"],
-                cwd=tmpdir_path,
-                capture_output=True,
-                text=True
-            )
+            result = self._run_install(["cargo", "fetch"], cwd=tmpdir_path)
 
             if result.returncode != 0:
                 raise RuntimeError(f"Failed to install {library_name}: {result.stderr}")
 
-            # Copy template
-            template_copy = tmpdir_path / "introspect.rs"
-            shutil.copy(template_path, template_copy)
-
             # Run introspection using cargo +nightly -Zscript if available,
             # otherwise compile and run
             modules_args = modules or []
-
-            # Try nightly script first
-            cmd = ["cargo", "+nightly", "-Zscript", str(template_copy), library_name, version] + modules_args
-
-            logger.debug(f"Running introspection: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                cwd=tmpdir_path,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-
-            # If nightly script fails, try standard compile
-            if result.returncode != 0:
-                logger.debug("Nightly script failed, trying standard compile...")
-                # Compile
-                compile_result = subprocess.run(
-                    ["rustc", str(template_copy), "-o", str(tmpdir_path / "introspect")],
-                    cwd=tmpdir_path,
-                    capture_output=True,
-                    text=True
-                )
-
-                if compile_result.returncode != 0:
-                    raise RuntimeError(f"Failed to compile Rust introspection: {compile_result.stderr}")
-
-                # Run
-                cmd = [str(tmpdir_path / "introspect"), library_name, version] + modules_args
-                result = subprocess.run(
-                    cmd,
-                    cwd=tmpdir_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-
-            if result.returncode != 0:
-                raise RuntimeError(f"Introspection failed: {result.stderr}")
-
-            # Parse JSON output
-            try:
-                output_data = json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse output: {result.stdout[:500]}")
-                raise RuntimeError(f"Invalid JSON output: {e}")
-
-            return IntrospectionResult(
-                language="rust",
-                library_name=library_name,
-                library_version=version,
-                apis=output_data.get("apis", []),
-                timestamp=datetime.now().isoformat(),
-                introspection_method="syn",
-                total_functions=output_data.get("by_type", {}).get("function", 0),
-                total_classes=output_data.get("by_type", {}).get("class", 0),
-                total_methods=output_data.get("by_type", {}).get("method", 0)
-            )
+            script_path, binary_path = self._rust_template_paths(template_path)
+
+            if binary_path.exists():
+                # Template was already compiled with rustc
+                cmd = [str(binary_path), library_name, version] + modules_args
+                output_data = self._run_template(cmd, cwd=tmpdir_path)
+            else:
+                # Try nightly script first. The script lives at a stable
+                # path, so cargo reuses its build across calls.
+                cmd = ["cargo", "+nightly", "-Zscript", str(script_path), library_name, version] + modules_args
+
+                try:
+                    output_data = self._run_template(cmd, cwd=tmpdir_path)
+                except RuntimeError:
+                    # If nightly script fails, try standard compile (once)
+                    logger.debug("Nightly script failed, trying standard compile...")
+                    # Compile
+                    binary_tmp = binary_path.with_name(
+                        f"{binary_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    )
+                    compile_result = subprocess.run(
+                        ["rustc", "-O", str(script_path), "-o", str(binary_tmp)],
+                        cwd=tmpdir_path,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True
+                    )
+
+                    if compile_result.returncode != 0:
+                        binary_tmp.unlink(missing_ok=True)
+                        raise RuntimeError(f"Failed to compile Rust introspection: {compile_result.stderr}")
+                    os.replace(binary_tmp, binary_path)
+
+                    # Run
+                    cmd = [str(binary_path), library_name, version] + modules_args
+                    output_data = self._run_template(cmd, cwd=tmpdir_path)
+
+            return output_data
 
 
 def introspect_library(
     library_name: str,
     version: str,
     language: str,
-    modules: Optional[List[str]] = None
+    modules: Optional[List[str]] = None,
+    use_cache: bool = True
 ) -> IntrospectionResult:
     """
     Convenience function to introspect a library.
 
+    Results are cached in memory and on disk by (library, version, backend,
+    modules, template hash), so repeat runs skip environment setup and
+    introspection entirely, and TypeScript/JavaScript share one result. Editing
+    a template invalidates its cached results, and results with no APIs (a
+    failed or empty run) are not cached. Concurrent calls for the same
+    key wait for a single introspection. A cached result keeps the timestamp
+    of the introspection that produced it.
+
     Args:
         library_name: Library name
         version: Version to introspect
         language: Programming language
-        modules: Optional specific modules
+        modules: Optional specific modules (order does not affect caching)
+        use_cache: Read and write cached results (default: True)
 
     Returns:
         IntrospectionResult with API surface
@@ -512,5 +818,155 @@ def introspect_library(
         >>> print(f"Found {result.total_functions} functions")
         >>> print(f"APIs: {len(result.apis)}")
     """
-    runner = IntrospectionRunner()
-    return runner.introspect_library(library_name, version, language, modules)
+    if not use_cache:
+        runner = IntrospectionRunner()
+        return runner.introspect_library(library_name, version, language, modules)
+
+    backend = _BACKEND_LANGUAGES.get(language, language)
+    template_hash = _template_hash(backend)
+    key = (library_name, version, backend, tuple(sorted(modules or ())), template_hash)
+
+    with _introspection_locks_guard:
+        lock = _introspection_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        if key in _introspection_cache:
+            logger.debug(f"Using in-memory introspection result for {library_name} {version} ({backend})")
+            return _introspection_cache[key]
+
+        cache_path = _introspection_cache_path(library_name, version, backend, modules, template_hash)
+        result = _load_cached_introspection(cache_path, library_name, version)
+
+        if result is None:
+            runner = IntrospectionRunner()
+            result = runner.introspect_library(library_name, version, backend, modules)
+
+            if not result.apis:
+                # Likely a failed install or import; retry next time
+                logger.warning(f"No APIs found for {library_name} {version} ({backend}); not caching")
+                return result
+
+            _save_cached_introspection(cache_path, result)
+
+        _introspection_cache[key] = result
+        return result
+
+
+def introspect_libraries(
+    specs: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> List[IntrospectionResult]:
+    """
+    Introspect several libraries concurrently.
+
+    Each introspection is a chain of subprocesses (venv/npm setup, template
+    run), so they run on a bounded thread pool; wall time approaches the
+    slowest spec rather than the sum.
+
+    Args:
+        specs: Keyword arguments for introspect_library(), one dict per call
+        max_workers: Maximum concurrent introspections (default: CPU count),
+            so large batches don't start dozens of installs at once
+
+    Returns:
+        IntrospectionResults in the same order as specs
+
+    Raises:
+        The first failing spec's exception, once all calls have finished
+
+    Example:
+        >>> results = introspect_libraries([
+        ...     {"library_name": "lancedb", "version": "0.25.2", "language": "python"},
+        ...     {"library_name": "@lancedb/lancedb", "version": "0.22.0", "language": "typescript"},
+        ... ])
+    """
+    if not specs:
+        return []
+
+    max_workers = max_workers or min(len(specs), os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(introspect_library, **spec) for spec in specs]
+
+    return [future.result() for future in futures]
+
+
+def _template_hash(backend: str) -> str:
+    """
+    Get a short content hash of a backend's bundled introspection template.
+
+    Returns an empty string if the backend has no template (the runner
+    reports the error).
+    """
+    template_name = _BACKEND_TEMPLATES.get(backend)
+    if template_name is None:
+        return ""
+
+    try:
+        template_bytes = (TEMPLATES_DIR / template_name).read_bytes()
+    except OSError:
+        return ""
+
+    return hashlib.sha256(template_bytes).hexdigest()[:16]
+
+
+def _introspection_cache_path(
+    library_name: str,
+    version: str,
+    language: str,
+    modules: Optional[List[str]] = None,
+    template_hash: str = ""
+) -> Path:
+    """Get the on-disk cache file for an introspection result."""
+    name = f"{library_name}-{version}-{language}"
+    if modules:
+        modules_key = json.dumps(sorted(modules))
+        name += "-" + hashlib.sha256(modules_key.encode('utf-8')).hexdigest()[:16]
+    if template_hash:
+        name += f"-t{template_hash}"
+
+    # Library names may contain '/' or '@' (Go modules, scoped npm packages)
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+    return INTROSPECTION_CACHE_DIR / f"{safe_name}.json"
+
+
+def _load_cached_introspection(
+    cache_path: Path,
+    library_name: str,
+    version: str
+) -> Optional[IntrospectionResult]:
+    """
+    Load a cached introspection result.
+
+    Returns None on a miss, an unreadable file, a library/version mismatch,
+    or a result with no APIs.
+    """
+    if not cache_path.exists():
+        return None
+
+    try:
+        result = IntrospectionResult.model_validate_json(cache_path.read_bytes())
+    except Exception as e:
+        logger.warning(f"Ignoring invalid introspection cache {cache_path}: {e}")
+        return None
+
+    if result.library_name != library_name or result.library_version != version:
+        return None
+
+    if not result.apis:
+        return None
+
+    logger.info(f"Using cached introspection: {cache_path}")
+    return result
+
+
+def _save_cached_introspection(cache_path: Path, result: IntrospectionResult):
+    """Atomically write an introspection result to the on-disk cache."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(result.model_dump_json(), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # Caching is best-effort; a read-only home must not fail the run
+        logger.warning(f"Could not write introspection cache {cache_path}: {e}")
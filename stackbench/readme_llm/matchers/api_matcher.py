@@ -7,7 +7,7 @@ infers complexity levels for ranking and organization.
 """
 
 import re
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, FrozenSet, Optional, Tuple
 from collections import defaultdict
 import logging
 
@@ -22,8 +22,46 @@ class APIExampleMatcher:
 
     Handles multiple programming languages with language-specific patterns
     for import detection, function calls, and method chaining.
+
+    Matching is a hash join: each example is scanned once for candidate
+    identifiers, and each one is kept only if it is a known API name.
     """
 
+    # Maps commas to spaces, so imported names (e.g. "connect, Table")
+    # split with a plain str.split()
+    ITEM_SEPARATOR_TABLE = str.maketrans(',', ' ')
+
+    # Python
+    PYTHON_IMPORT_PATTERN = re.compile(r'^\s*(?:from\s+(\S+)\s+)?import\s+([^\n]+)', re.MULTILINE)
+    PYTHON_CALL_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_\.]*)\s*\(')
+
+    # TypeScript/JavaScript
+    ES6_IMPORT_PATTERN = re.compile(r'import\s+\{([^}]+)\}\s+from\s+[\'"]([^\'"]+)[\'"]')
+    ES6_DEFAULT_IMPORT_PATTERN = re.compile(r'import\s+(\w+)\s+from\s+[\'"]([^\'"]+)[\'"]')
+    REQUIRE_PATTERN = re.compile(
+        r'(?:const|let|var)\s+(?:\{([^}]+)\}|(\w+))\s*=\s*require\([\'"]([^\'"]+)[\'"]\)'
+    )
+    JS_CALL_PATTERN = re.compile(r'([a-zA-Z_$][a-zA-Z0-9_$\.]*)\s*\(')
+
+    # Go
+    GO_IMPORT_PATTERN = re.compile(r'import\s+(?:"([^"]+)"|(\w+)\s+"([^"]+)")')
+    GO_CALL_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s*\(')
+
+    # Rust
+    RUST_USE_PATTERN = re.compile(r'use\s+([a-zA-Z_][a-zA-Z0-9_:]*(?:::\{[^}]+\})?)')
+    RUST_USE_ITEMS_PATTERN = re.compile(r'\{([^}]+)\}')
+    RUST_CALL_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*(?:::[a-zA-Z_][a-zA-Z0-9_]*)*)\s*\(')
+    RUST_METHOD_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)+)\s*\(')
+
+    # Matching method for each language
+    LANGUAGE_MATCHERS = {
+        'python': '_match_python',
+        'typescript': '_match_typescript_javascript',
+        'javascript': '_match_typescript_javascript',
+        'go': '_match_go',
+        'rust': '_match_rust',
+    }
+
     def __init__(self, introspection_result: IntrospectionResult):
         """
         Initialize API matcher with introspection data.
@@ -46,14 +84,43 @@ class APIExampleMatcher:
             if len(parts) > 0:
                 self.simple_api_names.add(parts[-1])
 
+        # Language-specific matching method, bound once (None: unsupported)
+        matcher_name = self.LANGUAGE_MATCHERS.get(self.language)
+        self._match_code = getattr(self, matcher_name) if matcher_name else None
+
+        # Per-attribute lookups used by infer_complexity
+        self._async_apis = {
+            api["api"] for api in introspection_result.apis if api.get("is_async", False)
+        }
+        self._api_types = {api["api"]: api.get("type") for api in introspection_result.apis}
+
+        # Every component-wise prefix of every API name, per call-chain
+        # separator ("lancedb", "lancedb.connect", ...), so walking a chain
+        # stops at the first prefix no API starts with; chains rooted at
+        # locals or builtins (print, len, ...) stop at their first component
+        self._api_prefixes: Dict[str, Set[str]] = {
+            separator: self._component_prefixes(separator)
+            for separator in ('.', '::')
+        }
+
+        # Matched APIs by example code, so snippets repeated across pages
+        # are only scanned once
+        self._matches_by_code: Dict[str, FrozenSet[str]] = {}
+
         logger.debug(f"Initialized matcher with {len(self.api_names)} APIs")
 
-    def match_examples(self, examples: List[CodeExample]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    def match_examples(
+        self,
+        examples: List[CodeExample],
+        complexity_out: Optional[Dict[str, str]] = None
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
         """
         Match code examples to APIs.
 
         Args:
             examples: List of CodeExample objects
+            complexity_out: Optional dict to fill with the complexity of each
+                matched example, computed in the same pass
 
         Returns:
             Tuple of (api_to_examples, example_to_apis):
@@ -65,10 +132,19 @@ class APIExampleMatcher:
 
         for example in examples:
             matched_apis = self._match_example_to_apis(example)
+            if not matched_apis:
+                continue
 
+            example_id = example.example_id
+            apis_used = example_to_apis[example_id]
             for api_name in matched_apis:
-                api_to_examples[api_name].append(example.example_id)
-                example_to_apis[example.example_id].append(api_name)
+                api_to_examples[api_name].append(example_id)
+                apis_used.append(api_name)
+
+            if complexity_out is not None:
+                # Recomputed if an ID repeats, so the last write sees all
+                # of that ID's APIs
+                complexity_out[example_id] = self.infer_complexity(example_id, apis_used)
 
         logger.info(
             f"Matched {len(examples)} examples to {len(api_to_examples)} APIs"
@@ -76,35 +152,103 @@ class APIExampleMatcher:
 
         return dict(api_to_examples), dict(example_to_apis)
 
-    def _match_example_to_apis(self, example: CodeExample) -> Set[str]:
+    def _match_example_to_apis(self, example: CodeExample) -> FrozenSet[str]:
         """
         Match a single example to APIs.
 
+        Results are memoized by code, since the same snippet often appears
+        on several pages.
+
         Args:
             example: CodeExample object
 
         Returns:
-            Set of matched API names
+            Frozen set of matched API names (shared between identical snippets)
         """
+        cached = self._matches_by_code.get(example.code)
+        if cached is not None:
+            logger.debug(f"Example {example.example_id}: reused match for identical code")
+            return cached
+
+        code = example.code
         matched_apis = set()
 
-        # Language-specific matching
-        if self.language == 'python':
-            matched_apis = self._match_python(example.code)
-        elif self.language in ('typescript', 'javascript'):
-            matched_apis = self._match_typescript_javascript(example.code)
-        elif self.language == 'go':
-            matched_apis = self._match_go(example.code)
-        elif self.language == 'rust':
-            matched_apis = self._match_rust(example.code)
+        # Every pattern needs a call paren or an import/use keyword, so
+        # prose, shell sessions and output blocks can skip the scan
+        if '(' not in code and 'import' not in code and 'use' not in code:
+            return frozenset()
 
-        # Filter to only known APIs
-        matched_apis = {api for api in matched_apis if api in self.api_names}
+        # Language-specific matching (only known API names are collected)
+        if self._match_code is not None:
+            matched_apis = self._match_code(code)
 
         logger.debug(f"Example {example.example_id}: matched {len(matched_apis)} APIs")
 
+        matched_apis = frozenset(matched_apis)
+        self._matches_by_code[example.code] = matched_apis
         return matched_apis
 
+    def _add_known(self, matched: Set[str], name: str):
+        """
+        Add a candidate name if it is a known API.
+
+        Args:
+            matched: Set to add matched API names to
+            name: Candidate API name found in the code
+        """
+        if name in self.api_names:
+            matched.add(name)
+
+    def _add_call_chain(self, matched: Set[str], call_chain: str, separator: str = '.'):
+        """
+        Add the known APIs among a call chain's prefixes.
+
+        For "db.open_table.search" this checks "db", "db.open_table" and
+        "db.open_table.search", extending the prefix one component at a
+        time and stopping at the first prefix no API name starts with.
+
+        Args:
+            matched: Set to add matched API names to
+            call_chain: Dotted (or "::"-separated) call chain
+            separator: Component separator
+        """
+        api_names = self.api_names
+        api_prefixes = self._api_prefixes[separator]
+        parts = call_chain.split(separator)
+
+        prefix = parts[0]
+        if prefix not in api_prefixes:
+            return
+        if prefix in api_names:
+            matched.add(prefix)
+
+        for part in parts[1:]:
+            prefix = f"{prefix}{separator}{part}"
+            if prefix not in api_prefixes:
+                return
+            if prefix in api_names:
+                matched.add(prefix)
+
+    def _component_prefixes(self, separator: str) -> Set[str]:
+        """
+        Collect the component-wise prefixes of all API names.
+
+        Args:
+            separator: Component separator
+
+        Returns:
+            Set of prefixes, including the full API names
+        """
+        prefixes = set()
+        for name in self.api_names:
+            parts = name.split(separator)
+            prefix = parts[0]
+            prefixes.add(prefix)
+            for part in parts[1:]:
+                prefix = f"{prefix}{separator}{part}"
+                prefixes.add(prefix)
+        return prefixes
+
     def _match_python(self, code: str) -> Set[str]:
         """
         Match Python code to APIs.
@@ -117,38 +261,26 @@ class APIExampleMatcher:
         matched = set()
 
         # 1. Extract imports
-        import_pattern = r'^\s*(?:from\s+(\S+)\s+)?import\s+([^\n]+)'
-        for match in re.finditer(import_pattern, code, re.MULTILINE):
+        for match in self.PYTHON_IMPORT_PATTERN.finditer(code):
             from_module = match.group(1)
             import_items = match.group(2)
 
             if from_module:
                 # from lancedb import connect, Table
-                for item in re.split(r'[,\s]+', import_items):
-                    item = item.strip()
-                    if item and not item.startswith('('):
+                for item in import_items.translate(self.ITEM_SEPARATOR_TABLE).split():
+                    if not item.startswith('('):
                         # Check both module.item and just item
-                        matched.add(f"{from_module}.{item}")
-                        matched.add(item)
+                        self._add_known(matched, f"{from_module}.{item}")
+                        self._add_known(matched, item)
             else:
                 # import lancedb
-                for item in re.split(r'[,\s]+', import_items):
-                    item = item.strip()
-                    if item and not item.startswith('('):
-                        matched.add(item)
+                for item in import_items.translate(self.ITEM_SEPARATOR_TABLE).split():
+                    if not item.startswith('('):
+                        self._add_known(matched, item)
 
-        # 2. Extract function/method calls
-        call_pattern = r'([a-zA-Z_][a-zA-Z0-9_\.]*)\s*\('
-        for match in re.finditer(call_pattern, code):
-            call_chain = match.group(1)
-
-            # Add full chain and components
-            matched.add(call_chain)
-
-            # Also add individual components
-            parts = call_chain.split('.')
-            for i in range(len(parts)):
-                matched.add('.'.join(parts[:i+1]))
+        # 2. Extract function/method calls (full chain and its prefixes)
+        for call_chain in self.PYTHON_CALL_PATTERN.findall(code):
+            self._add_call_chain(matched, call_chain)
 
         return matched
 
@@ -165,51 +297,39 @@ class APIExampleMatcher:
 
         # 1. ES6 imports
         # import { connect, Table } from 'lancedb'
-        es6_pattern = r'import\s+\{([^}]+)\}\s+from\s+[\'"]([^\'"]+)[\'"]'
-        for match in re.finditer(es6_pattern, code):
+        for match in self.ES6_IMPORT_PATTERN.finditer(code):
             items = match.group(1)
             module = match.group(2)
 
-            for item in re.split(r'[,\s]+', items):
-                item = item.strip()
-                if item and item != 'type':
-                    matched.add(f"{module}.{item}")
-                    matched.add(item)
+            for item in items.translate(self.ITEM_SEPARATOR_TABLE).split():
+                if item != 'type':
+                    self._add_known(matched, f"{module}.{item}")
+                    self._add_known(matched, item)
 
         # import lancedb from 'lancedb'
-        es6_default_pattern = r'import\s+(\w+)\s+from\s+[\'"]([^\'"]+)[\'"]'
-        for match in re.finditer(es6_default_pattern, code):
+        for match in self.ES6_DEFAULT_IMPORT_PATTERN.finditer(code):
             name = match.group(1)
             module = match.group(2)
-            matched.add(module)
-            matched.add(name)
+            self._add_known(matched, module)
+            self._add_known(matched, name)
 
         # 2. CommonJS requires
-        require_pattern = r'(?:const|let|var)\s+(?:\{([^}]+)\}|(\w+))\s*=\s*require\([\'"]([^\'"]+)[\'"]\)'
-        for match in re.finditer(require_pattern, code):
+        for match in self.REQUIRE_PATTERN.finditer(code):
             destructured = match.group(1)
             simple = match.group(2)
             module = match.group(3)
 
             if destructured:
-                for item in re.split(r'[,\s]+', destructured):
-                    item = item.strip()
-                    if item:
-                        matched.add(f"{module}.{item}")
-                        matched.add(item)
+                for item in destructured.translate(self.ITEM_SEPARATOR_TABLE).split():
+                    self._add_known(matched, f"{module}.{item}")
+                    self._add_known(matched, item)
             elif simple:
-                matched.add(module)
-                matched.add(simple)
+                self._add_known(matched, module)
+                self._add_known(matched, simple)
 
         # 3. Function/method calls
-        call_pattern = r'([a-zA-Z_$][a-zA-Z0-9_$\.]*)\s*\('
-        for match in re.finditer(call_pattern, code):
-            call_chain = match.group(1)
-            matched.add(call_chain)
-
-            parts = call_chain.split('.')
-            for i in range(len(parts)):
-                matched.add('.'.join(parts[:i+1]))
+        for call_chain in self.JS_CALL_PATTERN.findall(code):
+            self._add_call_chain(matched, call_chain)
 
         return matched
 
@@ -225,25 +345,18 @@ class APIExampleMatcher:
         matched = set()
 
         # 1. Extract imports
-        import_pattern = r'import\s+(?:"([^"]+)"|(\w+)\s+"([^"]+)")'
-        for match in re.finditer(import_pattern, code):
+        for match in self.GO_IMPORT_PATTERN.finditer(code):
             pkg = match.group(1) or match.group(3)
             alias = match.group(2)
 
             if pkg:
-                matched.add(pkg)
+                self._add_known(matched, pkg)
             if alias:
-                matched.add(alias)
+                self._add_known(matched, alias)
 
         # 2. Function calls (Package.Function or variable.Method)
-        call_pattern = r'([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s*\('
-        for match in re.finditer(call_pattern, code):
-            call_chain = match.group(1)
-            matched.add(call_chain)
-
-            parts = call_chain.split('.')
-            for i in range(len(parts)):
-                matched.add('.'.join(parts[:i+1]))
+        for call_chain in self.GO_CALL_PATTERN.findall(code):
+            self._add_call_chain(matched, call_chain)
 
         return matched
 
@@ -259,40 +372,28 @@ class APIExampleMatcher:
         matched = set()
 
         # 1. Extract use statements
-        use_pattern = r'use\s+([a-zA-Z_][a-zA-Z0-9_:]*(?:::\{[^}]+\})?)'
-        for match in re.finditer(use_pattern, code):
+        for match in self.RUST_USE_PATTERN.finditer(code):
             use_path = match.group(1)
 
             # Handle use crate::{A, B, C}
             if '::' in use_path and '{' in use_path:
                 base = use_path.split('::')[0]
-                items_match = re.search(r'\{([^}]+)\}', use_path)
+                items_match = self.RUST_USE_ITEMS_PATTERN.search(use_path)
                 if items_match:
                     items = items_match.group(1)
-                    for item in re.split(r'[,\s]+', items):
-                        item = item.strip()
-                        if item:
-                            matched.add(f"{base}::{item}")
-                            matched.add(item)
+                    for item in items.translate(self.ITEM_SEPARATOR_TABLE).split():
+                        self._add_known(matched, f"{base}::{item}")
+                        self._add_known(matched, item)
             else:
-                matched.add(use_path)
+                self._add_known(matched, use_path)
 
         # 2. Function calls (module::function or variable.method)
-        call_pattern = r'([a-zA-Z_][a-zA-Z0-9_]*(?:::[a-zA-Z_][a-zA-Z0-9_]*)*)\s*\('
-        for match in re.finditer(call_pattern, code):
-            call_chain = match.group(1)
-            matched.add(call_chain)
-
-            # Also add individual components
-            parts = call_chain.split('::')
-            for i in range(len(parts)):
-                matched.add('::'.join(parts[:i+1]))
+        for call_chain in self.RUST_CALL_PATTERN.findall(code):
+            self._add_call_chain(matched, call_chain, '::')
 
         # 3. Method calls (obj.method())
-        method_pattern = r'([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)+)\s*\('
-        for match in re.finditer(method_pattern, code):
-            call_chain = match.group(1)
-            matched.add(call_chain)
+        for call_chain in self.RUST_METHOD_PATTERN.findall(code):
+            self._add_known(matched, call_chain)
 
         return matched
 
@@ -314,17 +415,11 @@ class APIExampleMatcher:
         api_count = len(apis_used)
 
         # Check for advanced patterns
-        has_async = any(
-            self.api_by_name.get(api, {}).get("is_async", False)
-            for api in apis_used
-        )
+        has_async = not self._async_apis.isdisjoint(apis_used)
 
         # Count distinct types (functions vs methods vs classes)
-        types = set()
-        for api in apis_used:
-            api_data = self.api_by_name.get(api)
-            if api_data:
-                types.add(api_data.get("type"))
+        api_types = self._api_types
+        types = {api_types[api] for api in apis_used if api in api_types}
 
         # Complexity inference
         if api_count <= 2 and not has_async:
@@ -359,12 +454,9 @@ def match_examples_to_apis(
         >>> print(f"API lancedb.connect used in: {api_map['lancedb.connect']}")
     """
     matcher = APIExampleMatcher(introspection_result)
-    api_to_examples, example_to_apis = matcher.match_examples(examples)
 
-    # Infer complexity for each example
+    # Complexity is inferred for each example as it is matched
     example_complexity = {}
-    for example_id, apis in example_to_apis.items():
-        complexity = matcher.infer_complexity(example_id, apis)
-        example_complexity[example_id] = complexity
+    api_to_examples, example_to_apis = matcher.match_examples(examples, example_complexity)
 
     return api_to_examples, example_to_apis, example_complexity
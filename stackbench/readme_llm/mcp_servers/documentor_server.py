@@ -21,9 +21,12 @@ Usage:
         --knowledge-base-path data/run_123/readme_llm/knowledge_base
 """
 
+import os
 import sys
 import json
+import asyncio
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
@@ -129,9 +132,18 @@ class DocuMentorServer:
         # Load library overview
         self.library_overview = self._load_library_overview()
 
+        # Parsed metadata.json, reloaded only when the file changes
+        self._metadata_cache: Dict = {}
+        self._metadata_mtime: Optional[int] = None
+
         # Feedback storage
         self.feedback_file = self.kb_path.parent / "feedback.jsonl"
-        self.feedback_file.parent.mkdir(parents=True, exist_ok=True)
+        if not self.feedback_file.parent.is_dir():
+            self.feedback_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Append-only descriptor for feedback, opened on the first report
+        self._feedback_fd: Optional[int] = None
+        self._feedback_lock = threading.Lock()
 
         # Register tools
         self._register_tools()
@@ -146,50 +158,73 @@ class DocuMentorServer:
 
         return json.loads(overview_path.read_text(encoding='utf-8'))
 
+    def _get_metadata(self) -> Dict:
+        """
+        Get metadata.json, re-reading it only when its mtime changes.
+
+        Returns:
+            Parsed metadata (empty if the file does not exist)
+        """
+        metadata_path = self.kb_path / "metadata.json"
+        try:
+            mtime = metadata_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._metadata_cache, self._metadata_mtime = {}, None
+            return self._metadata_cache
+
+        if mtime != self._metadata_mtime:
+            self._metadata_cache = json.loads(metadata_path.read_text(encoding='utf-8'))
+            self._metadata_mtime = mtime
+
+        return self._metadata_cache
+
     def _register_tools(self):
         """Register all MCP tools."""
 
-        # Tool 1: get_library_overview
-        @self.server.list_tools()
-        async def list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="get_library_overview",
-                    description=(
-                        "Get high-level information about the library including name, version, "
-                        "supported languages, domain, key concepts, and quickstart summary. "
-                        "Use this first to understand what the library does."
-                    ),
-                    inputSchema=GetLibraryOverviewArgs.model_json_schema()
+        # Tool definitions are static, so their schemas are generated once
+        # here rather than on every list_tools request
+        self._tools = [
+            Tool(
+                name="get_library_overview",
+                description=(
+                    "Get high-level information about the library including name, version, "
+                    "supported languages, domain, key concepts, and quickstart summary. "
+                    "Use this first to understand what the library does."
                 ),
-                Tool(
-                    name="find_api",
-                    description=(
-                        "Search for library APIs (functions, classes, methods) by keyword query. "
-                        "Returns matching APIs with signatures, descriptions, importance scores, "
-                        "and related examples. Supports filtering by language and importance."
-                    ),
-                    inputSchema=FindAPIArgs.model_json_schema()
+                inputSchema=GetLibraryOverviewArgs.model_json_schema()
+            ),
+            Tool(
+                name="find_api",
+                description=(
+                    "Search for library APIs (functions, classes, methods) by keyword query. "
+                    "Returns matching APIs with signatures, descriptions, importance scores, "
+                    "and related examples. Supports filtering by language and importance."
                 ),
-                Tool(
-                    name="get_examples",
-                    description=(
-                        "Search for code examples by keyword query. Returns matching examples "
-                        "with code snippets, usage descriptions, complexity levels, and related APIs. "
-                        "Supports filtering by language and complexity."
-                    ),
-                    inputSchema=GetExamplesArgs.model_json_schema()
+                inputSchema=FindAPIArgs.model_json_schema()
+            ),
+            Tool(
+                name="get_examples",
+                description=(
+                    "Search for code examples by keyword query. Returns matching examples "
+                    "with code snippets, usage descriptions, complexity levels, and related APIs. "
+                    "Supports filtering by language and complexity."
                 ),
-                Tool(
-                    name="report_issue",
-                    description=(
-                        "Report a documentation issue or provide feedback. Use this when you "
-                        "encounter broken examples, incorrect API signatures, unclear documentation, "
-                        "or missing information. Issues are logged for library maintainers."
-                    ),
-                    inputSchema=ReportIssueArgs.model_json_schema()
+                inputSchema=GetExamplesArgs.model_json_schema()
+            ),
+            Tool(
+                name="report_issue",
+                description=(
+                    "Report a documentation issue or provide feedback. Use this when you "
+                    "encounter broken examples, incorrect API signatures, unclear documentation, "
+                    "or missing information. Issues are logged for library maintainers."
                 ),
-            ]
+                inputSchema=ReportIssueArgs.model_json_schema()
+            ),
+        ]
+
+        @self.server.list_tools()
+        async def list_tools() -> List[Tool]:
+            return self._tools
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Any) -> List[TextContent]:
@@ -230,11 +265,8 @@ class DocuMentorServer:
         Returns:
             Library overview with metadata, key concepts, and quickstart info
         """
-        # Load metadata for stats
-        metadata_path = self.kb_path / "metadata.json"
-        metadata = {}
-        if metadata_path.exists():
-            metadata = json.loads(metadata_path.read_text(encoding='utf-8'))
+        # Metadata for stats (cached between calls)
+        metadata = self._get_metadata()
 
         return {
             "success": True,
@@ -382,10 +414,11 @@ class DocuMentorServer:
         # Validate arguments
         validated_args = ReportIssueArgs(**args)
 
-        # Create feedback issue
+        # Create feedback issue (ID and timestamp from one clock read)
+        now = datetime.now()
         feedback = FeedbackIssue(
-            issue_id=f"issue_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
-            timestamp=datetime.now().isoformat(),
+            issue_id=f"issue_{now:%Y%m%d_%H%M%S_%f}",
+            timestamp=now.isoformat(),
             issue_type=validated_args.issue_type,
             severity=validated_args.severity,
             description=validated_args.description,
@@ -398,8 +431,11 @@ class DocuMentorServer:
 
         # Append to feedback file (JSONL format)
         try:
-            with open(self.feedback_file, 'a', encoding='utf-8') as f:
-                f.write(feedback.model_dump_json() + '\n')
+            # Write off the event loop so a slow disk doesn't stall other tool calls
+            await asyncio.to_thread(
+                self._append_feedback,
+                (feedback.model_dump_json() + '\n').encode('utf-8')
+            )
 
             logger.info(f"Feedback recorded: {feedback.issue_id}")
 
@@ -417,6 +453,30 @@ class DocuMentorServer:
                 "error": f"Failed to record feedback: {e}"
             }
 
+    def _append_feedback(self, payload: bytes):
+        """
+        Append one JSONL record to the feedback file.
+
+        The file stays open in O_APPEND mode for the life of the server, and
+        each record normally goes out in a single write, so records from
+        concurrent servers sharing the file don't interleave. Runs in a
+        worker thread; the lock covers the lazy open and the whole write
+        loop, so a partial write is completed before another record starts.
+
+        Args:
+            payload: Encoded record, including its trailing newline
+        """
+        with self._feedback_lock:
+            if self._feedback_fd is None:
+                self._feedback_fd = os.open(
+                    self.feedback_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+                )
+
+            view = memoryview(payload)
+            while view:
+                written = os.write(self._feedback_fd, view)
+                view = view[written:]
+
     # ========================================================================
     # SERVER LIFECYCLE
     # ========================================================================
@@ -424,12 +484,19 @@ class DocuMentorServer:
     async def run(self):
         """Run the MCP server (stdio mode)."""
         logger.info("Starting DocuMentor MCP server (stdio mode)")
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            # Wait for any in-flight feedback write before closing
+            with self._feedback_lock:
+                if self._feedback_fd is not None:
+                    os.close(self._feedback_fd)
+                    self._feedback_fd = None
 
 
 # ============================================================================
@@ -477,7 +544,6 @@ def main():
             search_mode=args.search_mode,
             vector_model=args.vector_model
         )
-        import asyncio
         asyncio.run(server.run())
     except Exception as e:
         logger.error(f"Server failed: {e}", exc_info=True)
@@ -0,0 +1,33 @@
+"""
+Record loading shared by the README.LLM retrieval systems.
+
+Resolves the file references in a knowledge base's index.json, for both
+per-record JSON files and sharded JSONL files.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict
+
+
+def load_entry(kb_path: Path, entry_meta: Dict) -> Dict:
+    """
+    Load an API or example record referenced by index.json.
+
+    Sharded knowledge bases keep all records for a language in one JSONL
+    file; the index then carries each record's byte offset and length.
+
+    Args:
+        kb_path: Knowledge base directory
+        entry_meta: Index entry with "file" (and "offset"/"length" if sharded)
+
+    Returns:
+        Parsed record
+    """
+    entry_file = kb_path / entry_meta["file"]
+    if "offset" not in entry_meta:
+        return json.loads(entry_file.read_text(encoding='utf-8'))
+
+    with open(entry_file, 'rb') as f:
+        f.seek(entry_meta["offset"])
+        return json.loads(f.read(entry_meta["length"]))
@@ -14,6 +14,7 @@ import math
 import logging
 
 from stackbench.readme_llm.schemas import SearchResult
+from stackbench.readme_llm.mcp_servers.retrieval.entry_loader import load_entry
 
 logger = logging.getLogger(__name__)
 
@@ -97,7 +98,7 @@ class KeywordRetrieval:
                     logger.warning(f"API file not found: {api_file}")
                     continue
 
-                api_data = json.loads(api_file.read_text(encoding='utf-8'))
+                api_data = load_entry(self.kb_path, api_meta)
 
                 # Extract searchable text
                 searchable_text = " ".join([
@@ -131,7 +132,7 @@ class KeywordRetrieval:
                     logger.warning(f"Example file not found: {example_file}")
                     continue
 
-                example_data = json.loads(example_file.read_text(encoding='utf-8'))
+                example_data = load_entry(self.kb_path, example_meta)
 
                 # Extract searchable text
                 searchable_text = " ".join([
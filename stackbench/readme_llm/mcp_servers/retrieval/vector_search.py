@@ -7,12 +7,15 @@ Provides deeper understanding of query intent beyond keyword matching.
 
 import json
 import pickle
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional, Set, Tuple
 import logging
 import numpy as np
 
 from stackbench.readme_llm.schemas import SearchResult
+from stackbench.readme_llm.mcp_servers.retrieval.entry_loader import load_entry
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,32 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     logger.warning("sentence-transformers not available. Install with: pip install sentence-transformers")
 
+# Loaded sentence-transformer models by name, shared by every VectorRetrieval
+# in the process (each model is hundreds of MB and takes seconds to load)
+_MODEL_CACHE: Dict[str, "SentenceTransformer"] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _load_model(model_name: str) -> "SentenceTransformer":
+    """
+    Load a sentence-transformer model, reusing it if already loaded.
+
+    Args:
+        model_name: Sentence-transformers model name
+
+    Returns:
+        Shared SentenceTransformer instance
+    """
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(model_name)
+        if model is None:
+            logger.info(f"Loading sentence-transformer model: {model_name}")
+            model = SentenceTransformer(model_name)
+            _MODEL_CACHE[model_name] = model
+        else:
+            logger.debug(f"Reusing loaded sentence-transformer model: {model_name}")
+        return model
+
 
 class VectorRetrieval:
     """
@@ -45,6 +74,9 @@ class VectorRetrieval:
 
     DEFAULT_MODEL = "all-MiniLM-L6-v2"  # Fast, good quality, 384 dimensions
 
+    # Number of query embeddings kept in memory (agents often repeat queries)
+    QUERY_CACHE_SIZE = 2048
+
     # Alternative models:
     # "all-mpnet-base-v2" - Highest quality, 768 dimensions, slower
     # "all-MiniLM-L12-v2" - Balanced, 384 dimensions
@@ -83,9 +115,12 @@ class VectorRetrieval:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load sentence-transformer model
-        logger.info(f"Loading sentence-transformer model: {self.model_name}")
-        self.model = SentenceTransformer(self.model_name)
+        # Load sentence-transformer model (shared across instances)
+        self.model = _load_model(self.model_name)
+
+        # Recently encoded queries (LRU, {query: embedding})
+        self._query_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
 
         # Data structures
         self.api_data: Dict[str, Dict] = {}  # {api_id: full_data}
@@ -242,7 +277,7 @@ class VectorRetrieval:
                     logger.warning(f"API file not found: {api_file}")
                     continue
 
-                api_data = json.loads(api_file.read_text(encoding='utf-8'))
+                api_data = load_entry(self.kb_path, api_meta)
 
                 # Create searchable text for embedding
                 text_parts = [
@@ -285,7 +320,7 @@ class VectorRetrieval:
                     logger.warning(f"Example file not found: {example_file}")
                     continue
 
-                example_data = json.loads(example_file.read_text(encoding='utf-8'))
+                example_data = load_entry(self.kb_path, example_meta)
 
                 # Create searchable text for embedding
                 text_parts = [
@@ -349,6 +384,32 @@ class VectorRetrieval:
         except Exception as e:
             logger.warning(f"Failed to save example embeddings cache: {e}")
 
+    def _encode_query(self, query: str) -> np.ndarray:
+        """
+        Encode a search query, reusing the embedding of a repeated query.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Read-only query embedding (shared between calls)
+        """
+        with self._query_embeddings_lock:
+            embedding = self._query_embeddings.get(query)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(query)
+                return embedding
+
+        embedding = self.model.encode(query, convert_to_numpy=True)
+        embedding.setflags(write=False)
+
+        with self._query_embeddings_lock:
+            self._query_embeddings[query] = embedding
+            if len(self._query_embeddings) > self.QUERY_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+
+        return embedding
+
     def _cosine_similarity(self, query_embedding: np.ndarray, doc_embeddings: np.ndarray) -> np.ndarray:
         """
         Calculate cosine similarity between query and documents.
@@ -393,8 +454,8 @@ class VectorRetrieval:
         if len(self.api_ids) == 0:
             return []
 
-        # Encode query
-        query_embedding = self.model.encode(query, convert_to_numpy=True)
+        # Encode query (cached)
+        query_embedding = self._encode_query(query)
 
         # Calculate similarities
         similarities = self._cosine_similarity(query_embedding, self.api_embeddings)
@@ -460,8 +521,8 @@ class VectorRetrieval:
         if len(self.example_ids) == 0:
             return []
 
-        # Encode query
-        query_embedding = self.model.encode(query, convert_to_numpy=True)
+        # Encode query (cached)
+        query_embedding = self._encode_query(query)
 
         # Calculate similarities
         similarities = self._cosine_similarity(query_embedding, self.example_embeddings)
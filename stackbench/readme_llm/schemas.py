@@ -239,6 +239,10 @@ class ExampleEntry(BaseModel):
     )
     source_file: str = Field(description="Documentation file path")
     line_number: int = Field(description="Location in file")
+    is_complete: bool = Field(
+        True,
+        description="Whether this is a full program vs snippet"
+    )
 
     class Config:
         json_schema_extra = {
@@ -260,7 +264,8 @@ class ExampleEntry(BaseModel):
                     "timestamp": "2025-01-15T10:30:00Z"
                 },
                 "source_file": "docs/quickstart.md",
-                "line_number": 42
+                "line_number": 42,
+                "is_complete": True
             }
         }
 
@@ -1,5 +1,5 @@
 """Utility functions for README.LLM system."""
 
-from .file_scanner import FileScanner, scan_documentation
+from .file_scanner import FileScanner, scan_documentation, iter_documentation
 
-__all__ = ["FileScanner", "scan_documentation"]
+__all__ = ["FileScanner", "scan_documentation", "iter_documentation"]
@@ -6,8 +6,9 @@ Recursively scans a documentation directory to find all documentation files
 to discover all documentation that needs to be processed.
 """
 
+import os
 from pathlib import Path
-from typing import List, Set, Optional
+from typing import Iterator, List, Set, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -83,16 +84,11 @@ class FileScanner:
             List of Path objects for all documentation files found,
             sorted by path for consistent ordering.
         """
-        doc_files = []
-
         logger.info(f"Scanning documentation directory: {self.base_path}")
         logger.debug(f"Looking for extensions: {', '.join(self.extensions)}")
         logger.debug(f"Excluding directories: {', '.join(self.exclude_dirs)}")
 
-        for file_path in self._walk_directory(self.base_path):
-            if file_path.suffix in self.extensions:
-                doc_files.append(file_path)
-                logger.debug(f"Found documentation file: {file_path.relative_to(self.base_path)}")
+        doc_files = list(self.iter_scan())
 
         # Sort for consistent ordering
         doc_files.sort()
@@ -102,33 +98,55 @@ class FileScanner:
 
         return doc_files
 
+    def iter_scan(self) -> Iterator[Path]:
+        """
+        Lazily scan the base directory for documentation files.
+
+        Unlike scan(), paths are yielded in directory order as the walk
+        proceeds, so consumers can start processing before it finishes.
+
+        Yields:
+            Path objects for documentation files (unsorted)
+        """
+        for file_path in self._walk_directory(self.base_path):
+            logger.debug(f"Found documentation file: {file_path.relative_to(self.base_path)}")
+            yield file_path
+
     def _walk_directory(self, directory: Path):
         """
-        Recursively walk directory, yielding files while respecting exclusions.
+        Recursively walk directory, yielding documentation files while
+        respecting exclusions.
+
+        Uses os.scandir so file types come from the cached directory entry
+        instead of a stat call per item, and checks the extension on the
+        entry name before building a Path.
 
         Args:
             directory: Directory to walk
 
         Yields:
-            Path objects for files found
+            Path objects for files with a supported extension
         """
         try:
-            for item in directory.iterdir():
-                # Skip hidden files and directories (starting with .)
-                if item.name.startswith('.') and item.name not in {'.github'}:
-                    continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
 
-                if item.is_dir():
-                    # Skip excluded directories
-                    if item.name in self.exclude_dirs:
-                        logger.debug(f"Skipping excluded directory: {item.name}")
+                    # Skip hidden files and directories (starting with .)
+                    if name.startswith('.') and name not in {'.github'}:
                         continue
 
-                    # Recursively scan subdirectory
-                    yield from self._walk_directory(item)
+                    if entry.is_dir():
+                        # Skip excluded directories
+                        if name in self.exclude_dirs:
+                            logger.debug(f"Skipping excluded directory: {name}")
+                            continue
 
-                elif item.is_file():
-                    yield item
+                        # Recursively scan subdirectory
+                        yield from self._walk_directory(Path(entry.path))
+
+                    elif os.path.splitext(name)[1] in self.extensions and entry.is_file():
+                        yield Path(entry.path)
 
         except PermissionError:
             logger.warning(f"Permission denied accessing: {directory}")
@@ -260,3 +278,20 @@ def scan_documentation(
         return scanner.scan_filtered(include_patterns, exclude_patterns)
 
     return scanner.scan()
+
+
+def iter_documentation(docs_path: Path) -> Iterator[Path]:
+    """
+    Convenience function to lazily scan a documentation directory.
+
+    Args:
+        docs_path: Base documentation directory
+
+    Yields:
+        Documentation file paths, unsorted, as they are found
+
+    Example:
+        >>> for doc in iter_documentation(Path("docs/src")):
+        ...     print(doc.name)
+    """
+    yield from FileScanner(docs_path).iter_scan()